@@ -19,6 +19,7 @@ __version__ = "0.0.1"
 
 # Start of development
 _birthday = _date(2018, 4, 20)
+_today = _date.today()
 
 
 # Maintainers of Posetta
@@ -28,10 +29,11 @@ _AUTHORS = [
     _Author("Kristian Evers", "kbevers@sdfe.dk", _birthday, _date.max),
 ]
 
-__author__ = ", ".join(a.name for a in _AUTHORS if a.start < _date.today() < a.end)
-__contact__ = ", ".join(a.email for a in _AUTHORS if a.start < _date.today() < a.end)
+_active_authors = [a for a in _AUTHORS if a.start < _today < a.end]
+__author__ = ", ".join(a.name for a in _active_authors)
+__contact__ = ", ".join(a.email for a in _active_authors)
 __url__ = "https://github.com/NordicGeodesy/posetta"
 
 
 # Copyleft of the library
-__copyright__ = f"{_birthday.year} - {_date.today().year} Nordic Geodetic Commision"
+__copyright__ = f"{_birthday.year} - {_today.year} Nordic Geodetic Commision"
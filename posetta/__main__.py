@@ -12,6 +12,10 @@ Convert file_1.txt in XYZ-format to file_2.gri in GRI-format:
 
   $ posetta -f file_1.txt -F xyz -t file_2.gri -T gri
 
+Convert all files in the directory in_dir to GRI-format files in out_dir:
+
+  $ posetta -B -f in_dir -F xyz -t out_dir -T gri
+
 \b
 Input Formats:
 --------------
@@ -42,22 +46,32 @@ Contributions are welcome at {url}.
 """
 
 # Standard library imports
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import io
 import pathlib
 import sys
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, IO, Iterator, Optional, Union
 
 # Third party imports
 import click
 
 # Posetta imports
 import posetta
-from posetta import readers
-from posetta import writers
 
 
+# Buffer size used when reading from stdin and writing to stdout
+_STREAM_BUFFER_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=1)
 def help_str() -> str:
     """Add information to the module doc-string for a complete help message
     """
+    from posetta import readers, writers  # Local import to only find plugins if needed
+
     maintainers = [
         f"  + {name} <{email}>"
         for name, email in zip(
@@ -74,10 +88,26 @@ def help_str() -> str:
     )
 
 
+class LazyHelpCommand(click.Command):
+    """Click command that creates its help message when the help is shown
+
+    Creating the help message lists all readers and writers, which is only needed
+    when the user asks for help.
+    """
+
+    def format_help_text(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """Set the full help message before formatting it
+        """
+        self.help = help_str()
+        super().format_help_text(ctx, formatter)
+
+
 #
 # Starting Point of Command Line Tool
 #
-@click.command(help=help_str())
+@click.command(cls=LazyHelpCommand)
 @click.option("-f", "--file_from", help="Path of input file. Default is stdin.")
 @click.option("-t", "--file_to", help="Path of output file. Default is stdout.")
 @click.option(
@@ -89,6 +119,12 @@ def help_str() -> str:
 @click.option(
     "-O", "--overwrite", is_flag=True, help="Overwrite if output file already exists."
 )
+@click.option(
+    "-B",
+    "--batch",
+    is_flag=True,
+    help="Translate all files in the directory file_from to the directory file_to.",
+)
 @click.option("-V", "--verbose", is_flag=True, help="Say what is happening.")
 @click.version_option(None, "-v", "--version")
 @click.help_option("-h", "--help")
@@ -99,7 +135,10 @@ def cli(
 
     Implemented using click: http://click.pocoo.org
     """
-    translate(file_from, file_to, fmt_from, fmt_to, options)
+    if options.get("batch"):
+        batch_translate(file_from, file_to, fmt_from, fmt_to, options)
+    else:
+        translate(file_from, file_to, fmt_from, fmt_to, options)
 
 
 #
@@ -134,10 +173,12 @@ def translate(
         fmt_to:     Format of output file.
         options:    Additional options.
     """
+    from posetta import readers, writers  # Local import to only find plugins if needed
+
     options = options or dict()
     verbose = _verbose_on if options.get("verbose") else _verbose_off
-    path_from = None if file_from is None else pathlib.Path(file_from)
-    path_to = None if file_to is None else pathlib.Path(file_to)
+    path_from = _as_path(file_from)
+    path_to = _as_path(file_to)
 
     # Check input parameters
     if path_from is not None and not path_from.exists():
@@ -148,52 +189,187 @@ def translate(
             f"Output file '{path_to}' already exists. Use --overwrite to overwrite it."
         )
 
-    if fmt_from is not None and not readers.exists(fmt_from):
-        fmts = ", ".join(readers.names())
-        raise click.BadParameter(
-            f"Input format '{fmt_from}' is not supported. Use one of {fmts}"
-        )
-
-    if fmt_to is None or not writers.exists(fmt_to):
-        fmts = ", ".join(writers.names())
-        raise click.BadParameter(
-            f"Output format '{fmt_to}' is not supported. Use one of {fmts}"
-        )
+    _check_formats(fmt_from, fmt_to)
 
     # Read input as CoordSet
     if path_from is None:
         verbose("Reading from standard input")
-        cset = readers.read_stream(sys.stdin.buffer, fmt_from).as_coordset()
+        with _large_buffer(sys.stdin.buffer) as input_stream:
+            cset = readers.read_stream(input_stream, fmt_from).as_coordset()
     else:
-        verbose(f"Reading from '{path_from}'")
-        cset = readers.read_file(path_from, fmt_from).as_coordset()
+        verbose("Reading from '{}'", path_from)
+        use_mmap = options.get("use_mmap", True)
+        cset = readers.read_file(path_from, fmt_from, use_mmap=use_mmap).as_coordset()
 
     # Write CoordSet to new format
     if path_to is None:
         verbose("Writing to standard output")
+        sys.stdout.flush()
         writers.write_stream(sys.stdout.buffer, fmt_to, cset)
     else:
-        verbose(f"Writing to '{path_to}'")
+        verbose("Writing to '{}'", path_to)
         writers.write_file(path_to, fmt_to, cset)
 
 
+def batch_translate(
+    dir_from: Union[str, pathlib.Path],
+    dir_to: Union[str, pathlib.Path],
+    fmt_from: str,
+    fmt_to: str,
+    options: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Translate all files in a directory
+
+    Each file in dir_from is read with format fmt_from and written to a file in
+    dir_to with the same name and fmt_to as suffix. The formats, and that no two
+    input files give the same output file, are checked before any files are
+    translated. The files are translated in parallel, in separate processes.
+
+    Args:
+        dir_from:   Name of directory with input files.
+        dir_to:     Name of directory for output files.
+        fmt_from:   Format of input files.
+        fmt_to:     Format of output files.
+        options:    Additional options.
+    """
+    path_from = _as_path(dir_from)
+    if path_from is None or not path_from.is_dir():
+        raise click.BadParameter(f"Input directory '{dir_from}' does not exist")
+
+    if dir_to is None:
+        raise click.BadParameter("Output directory must be given in batch mode")
+
+    _check_formats(fmt_from, fmt_to)
+
+    # Check that no output file will be written twice, before translating any files
+    path_to = pathlib.Path(dir_to)
+    files_from = [p for p in sorted(path_from.iterdir()) if p.is_file()]
+    files_to = [path_to / f"{p.stem}.{fmt_to}" for p in files_from]
+    duplicates = [p.name for p, num in collections.Counter(files_to).items() if num > 1]
+    if duplicates:
+        raise click.BadParameter(
+            f"Several input files would be written to {', '.join(duplicates)}"
+        )
+
+    path_to.mkdir(parents=True, exist_ok=True)
+    if len(files_from) <= 1:
+        for file_from, file_to in zip(files_from, files_to):
+            translate(file_from, file_to, fmt_from, fmt_to, options)
+        return
+
+    # Translate each file in a separate process, as reading and writing is bound by
+    # parsing and formatting values in Python
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(translate, file_from, file_to, fmt_from, fmt_to, options)
+            for file_from, file_to in zip(files_from, files_to)
+        ]
+        for future in futures:
+            future.result()  # Raise errors from the worker processes
+
+
 #
 # Convenience functions
 #
-def _verbose_on(text: str) -> None:
+def _as_path(file_name: Union[None, str, pathlib.Path]) -> Optional[pathlib.Path]:
+    """Convert a file name to a path
+
+    Paths are returned as they are, without being parsed again.
+
+    Args:
+        file_name:  Name of file or directory, may be None.
+
+    Returns:
+        Path to the file or directory, None if file_name is None.
+    """
+    if file_name is None or isinstance(file_name, pathlib.Path):
+        return file_name
+    return pathlib.Path(file_name)
+
+
+def _check_formats(fmt_from: Optional[str], fmt_to: Optional[str]) -> None:
+    """Check that the input and output formats are supported
+
+    A missing input format is accepted, as the reader may be identified from the
+    input. A BadParameter error is raised if a format is not supported.
+
+    Args:
+        fmt_from:   Format of input file.
+        fmt_to:     Format of output file.
+    """
+    if fmt_from is not None:
+        _check_format("posetta.readers", fmt_from, "Input")
+    _check_format("posetta.writers", fmt_to, "Output")
+
+
+def _check_format(package_name: str, fmt: Optional[str], kind: str) -> None:
+    """Check that one format is supported by a reader or writer
+
+    Only the plug-in for the given format is imported. All plug-ins in the package
+    are only listed when the format is not supported. Both lookups are cached by
+    posetta.lib.plugins, so repeated checks, for instance in batch mode, are cheap.
+
+    Args:
+        package_name:  Name of package containing plug-ins.
+        fmt:           Format that should be checked.
+        kind:          Kind of format, used in the error message.
+    """
+    from posetta.lib import plugins  # Local import to only find plugins if needed
+
+    if fmt is None or not plugins.exists(package_name, fmt):
+        fmts = ", ".join(plugins.list_all(package_name))
+        raise click.BadParameter(
+            f"{kind} format '{fmt}' is not supported. Use one of {fmts}"
+        )
+
+
+@contextlib.contextmanager
+def _large_buffer(stream: IO[bytes]) -> Iterator[IO[bytes]]:
+    """Wrap standard input in a read buffer of size _STREAM_BUFFER_SIZE
+
+    The default buffer of stdin is small, causing many system calls when large files
+    are piped through Posetta. The large buffer is detached when done, so that the
+    standard stream itself is not closed. Standard output needs no extra buffer, as
+    the writers already buffer their output.
+
+    Args:
+        stream:  Buffered standard input stream, typically sys.stdin.buffer.
+
+    Returns:
+        Context manager giving the stream wrapped in a large buffer.
+    """
+    raw = getattr(stream, "raw", None)
+    if raw is None:
+        yield stream
+        return
+
+    buffered = io.BufferedReader(raw, buffer_size=_STREAM_BUFFER_SIZE)
+    try:
+        yield buffered
+    finally:
+        buffered.detach()
+
+
+def _verbose_on(text: str, *args: Any) -> None:
     """Print text to stdout
 
+    The text is formatted with the given arguments before it is printed.
+
     Args:
         text:  Text that should be printed.
+        args:  Arguments used to format the text.
     """
-    print(text)
+    print(text.format(*args))
 
 
-def _verbose_off(text: str) -> None:
+def _verbose_off(text: str, *args: Any) -> None:
     """Do nothing
 
+    In particular, the text is not formatted.
+
     Args:
         text:  Text that will not be printed.
+        args:  Arguments that will not be used.
     """
     pass
 
@@ -9,29 +9,34 @@ different coordinate data formats.
 """
 
 # Standard library imports
-from collections import namedtuple
-from typing import cast, Dict, List, Optional
+from typing import Any, cast, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 # Third party imports
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd  # Pandas is imported in as_dataframe when needed
+    import pyarrow as pa  # PyArrow is imported in as_arrow_table when needed
 
 # Posetta imports
 from posetta.data import coordset_meta
 from posetta.lib import exceptions
 
 
-# Tables of the CoordSet
-_TableSpec = namedtuple("_TableSpec", ("name", "num_cols"))
+# Tables of the CoordSet, given as (name, number of columns, dtype). A dtype of None
+# means that columns are stored with the dtype they are added with.
 _TABLES = (
-    _TableSpec("epochs", 1),
-    _TableSpec("positions", 3),
-    _TableSpec("velocities", 3),
-    _TableSpec("values", None),
+    ("epochs", 1, np.float64),
+    ("positions", 3, np.float64),
+    ("velocities", 3, np.float64),
+    ("values", None, None),
 )
 
-# Column specification
-ColumnSpec = namedtuple("ColumnSpec", ("table", "idx"))
+# Number of columns and dtype of each table, looked up by table name
+_TABLE_MAP = {name: (num_cols, dtype) for name, num_cols, dtype in _TABLES}
+
+# Column specification, given as (table name, column index)
+ColumnSpec = Tuple[str, int]
 
 
 class CoordSet:
@@ -42,15 +47,63 @@ class CoordSet:
         meta:       Metainformation about the dataset.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, dtypes: Optional[Dict[str, Any]] = None) -> None:
         """Set up tables for the CoordSet
+
+        Args:
+            dtypes:  Dtypes used for storing tables, overriding the defaults.
         """
+        dtypes = dtypes or dict()
         self.num_obs = 0
         self.meta = coordset_meta.CoordSetMeta()
         self.columns: Dict[str, ColumnSpec] = dict()
-        self.tables = {t.name: Table(t.num_cols) for t in _TABLES}
-        for table_name, table in self.tables.items():
-            setattr(self, table_name, table)
+        self.tables = _Tables(dtypes)
+
+    def __getattr__(self, name: str) -> "Table":
+        """Give access to the tables as attributes, e.g. cset.positions
+        """
+        if name in _TABLE_MAP:
+            return self.tables[name]
+        raise AttributeError(f"{type(self).__name__!r} has no attribute {name!r}")
+
+    @classmethod
+    def from_matrix(
+        cls,
+        matrix: np.ndarray,
+        column_names: List[str],
+        column_specs: Sequence[Tuple[str, Optional[int]]],
+        dtypes: Optional[Dict[str, Any]] = None,
+    ) -> "CoordSet":
+        """Create a CoordSet from a 2D array with one column for each column name
+
+        The columns are added to the tables one block at a time, instead of column by
+        column. The order of the columns in the CoordSet is the same as in the matrix.
+
+        Args:
+            matrix:        2D array of values.
+            column_names:  Name of each column in the matrix.
+            column_specs:  Table name and index within table for each column.
+            dtypes:        Dtypes used for storing tables, overriding the defaults.
+
+        Returns:
+            Coordinate dataset containing the columns of the matrix.
+        """
+        cset = cls(dtypes=dtypes)
+        cols_by_table: Dict[str, List[int]] = dict()
+        for col, (table_name, _) in enumerate(column_specs):
+            cols_by_table.setdefault(table_name, []).append(col)
+
+        for table_name, cols in cols_by_table.items():
+            # Slice adjacent columns, so that the block is only copied by add_block
+            is_adjacent = cols == list(range(cols[0], cols[-1] + 1))
+            cset.add_block(
+                table_name,
+                matrix[:, cols[0] : cols[-1] + 1] if is_adjacent else matrix[:, cols],
+                [column_names[col] for col in cols],
+                [column_specs[col][1] for col in cols],
+            )
+        cset.columns = {name: cset.columns[name] for name in column_names}
+        return cset
 
     def add(
         self,
@@ -70,93 +123,267 @@ class CoordSet:
         When adding a column the idx parameter must be between 0 and the above mentioned
         number of colums. If adding a 'value' the index should be set to None, which
         creates a generic table that can hold any number of data columns.
+
+        The values are copied into the CoordSet.
         """
-        # Check that number of observations are consistent
-        val_num_obs = len(val)
-        if not self.columns:
-            self.num_obs = val_num_obs
-        elif val_num_obs != self.num_obs:
-            raise exceptions.CoordSetError(
-                f"The number of values of {column_name} are not "
-                f"consistent with data already in the CoordSet"
-            )
+        self._check_num_obs(len(val), column_name)
 
         # Add value to table at specified index
         idx = self.tables[table_name].add_column(column_name, val, idx)
 
         # Update meta information
-        self.columns[column_name] = ColumnSpec(table_name, idx)
+        self.columns[column_name] = (table_name, idx)
+
+    def add_block(
+        self,
+        table_name: str,
+        vals: np.ndarray,
+        column_names: List[str],
+        idxs: Optional[List[Optional[int]]] = None,
+    ) -> None:
+        """Add several columns of values to the CoordSet at once
+
+        The values are given as a 2D array with one column for each column name. The
+        number of observations is checked once for the whole block, which is cheaper
+        than adding the columns one by one for readers parsing a full matrix.
+        """
+        vals = np.asarray(vals)
+        self._check_num_obs(vals.shape[0], ", ".join(column_names))
+
+        # Add values to table at specified indices
+        col_idxs = self.tables[table_name].add_columns(column_names, vals, idxs)
+
+        # Update meta information
+        self.columns.update(
+            (n, (table_name, i)) for n, i in zip(column_names, col_idxs)
+        )
+
+    def _check_num_obs(self, val_num_obs: int, column_name: str) -> None:
+        """Check that number of observations are consistent
+
+        The number of observations is set by the first column added to the CoordSet.
+        """
+        if val_num_obs == self.num_obs:
+            return
+        if self.columns:
+            raise exceptions.CoordSetError(
+                f"The number of values of {column_name} are not "
+                f"consistent with data already in the CoordSet"
+            )
+        self.num_obs = val_num_obs
 
     def as_dict(self) -> Dict[str, np.ndarray]:
         """Return columns of coordinate dataset as dictionary
+
+        The columns are the arrays stored in the dataset, not copies. Each is a
+        C-contiguous 1D array, so it can be passed on through the buffer protocol or
+        `__array_interface__`, for instance to PROJ bindings, without being copied.
         """
         data = dict()
-        for column, table in self.columns.items():
-            values = self.tables[table.table].values
-            if values is not None:
-                data[column] = values[:, table.idx]
+        for column, (table_name, idx) in self.columns.items():
+            data[column] = cast(np.ndarray, self.tables[table_name].column(idx))
         return data
 
-    def as_dataframe(self) -> pd.DataFrame:
+    def as_dataframe(self) -> "pd.DataFrame":
         """Return coordinate dataset as Pandas DataFrame
+
+        Columns from tables with a fixed number of columns are passed to Pandas as one
+        2D block per table, instead of one column at a time.
         """
-        return pd.DataFrame(self.as_dict())
+        import pandas as pd
+
+        frames = list()
+        for table_name, columns in self._columns_by_table().items():
+            table = self.tables[table_name]
+            names = [c for c, _ in columns]
+            if table.is_expandable:
+                frames.append(pd.DataFrame({c: table.column(i) for c, i in columns}))
+            else:
+                block = _column_block([table.column(i) for _, i in columns])
+                frames.append(pd.DataFrame(block, columns=names))
+
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames, axis=1)
+        if list(df.columns) != list(self.columns):
+            df = df[list(self.columns)]
+        return df
+
+    def as_arrow_table(self) -> "pa.Table":
+        """Return coordinate dataset as PyArrow Table
+
+        Contiguous numeric columns are wrapped by PyArrow without being copied, which
+        avoids the detour through Pandas for Arrow based formats like Parquet and
+        Feather. PyArrow is an optional dependency, imported when this is called.
+        """
+        import pyarrow as pa
+
+        data = self.as_dict()
+        arrays = [pa.array(values) for values in data.values()]
+        return pa.Table.from_arrays(arrays, names=list(data))
+
+    def _columns_by_table(self) -> Dict[str, List[Tuple[str, int]]]:
+        """Group the columns of the dataset by the table they are stored in
+        """
+        tables: Dict[str, List[Tuple[str, int]]] = dict()
+        for column, (table_name, idx) in self.columns.items():
+            tables.setdefault(table_name, list()).append((column, idx))
+        return tables
 
     def __repr__(self) -> str:
         """A simple string representation of the CoordSet
         """
-        tables = [n for n, t in self.tables.items() if t.values is not None]
+        tables = [
+            name
+            for name in _TABLE_MAP
+            if name in self.tables and self.tables[name].has_data
+        ]
         return f"{self.__class__.__name__}({', '.join(tables)})"
 
 
+class _Tables(Dict[str, "Table"]):
+    """Tables of a CoordSet, created the first time they are looked up
+    """
+
+    def __init__(self, dtypes: Dict[str, Any]) -> None:
+        super().__init__()
+        self._dtypes = dtypes
+
+    def __missing__(self, name: str) -> "Table":
+        num_cols, dtype = _TABLE_MAP[name]
+        table = self[name] = Table(num_cols, self._dtypes.get(name, dtype))
+        return table
+
+
+def _column_block(columns: List[Optional[np.ndarray]], dtype: Any = None) -> np.ndarray:
+    """Combine columns into one 2D array
+
+    The array is created in column major (Fortran) order, so that each column is
+    copied into contiguous memory. Missing columns are filled with NaN.
+
+    Args:
+        columns:  Columns of the array, None for missing columns.
+        dtype:    Dtype of the array, by default found from the columns.
+
+    Returns:
+        2D array with the columns.
+    """
+    existing = [c for c in columns if c is not None]
+    if dtype is None:
+        dtype = np.result_type(*existing)
+    block = np.empty((len(existing[0]), len(columns)), dtype=dtype, order="F")
+    for idx, column in enumerate(columns):
+        block[:, idx] = np.nan if column is None else column
+    return block
+
+
 class Table:
     """Table with columns used in CoordSet
+
+    The columns of the table are stored as separate 1D arrays. Adding a column does
+    not copy the columns already in the table, and each column keeps its own
+    contiguous memory. The 2D `values` array is only assembled when it is accessed.
     """
 
-    def __init__(self, num_cols: Optional[int] = None) -> None:
+    def __init__(self, num_cols: Optional[int] = None, dtype: Any = None) -> None:
         """Prepare one table
+
+        No memory is allocated for the values until the first column is added.
         """
         self._is_expandable = num_cols is None
         self.num_cols = num_cols or 0
-        self.values = np.full((0, self.num_cols), np.nan)
+        self.dtype = dtype
         self.col_names = [""] * self.num_cols
+        self._cols: List[Optional[np.ndarray]] = [None] * self.num_cols
+        self._values: Optional[np.ndarray] = None
+
+    @property
+    def values(self) -> Optional[np.ndarray]:
+        """2D array with all values in the table, None if the table is empty
+
+        Columns in a fixed size table that have not been added are read as NaN.
+
+        The array is a read-only copy assembled from the columns of the table, so
+        trying to change values through it raises an error. Use `add_column` to
+        change the values in the table.
+        """
+        if self._values is None and self.has_data:
+            self._values = _column_block(self._cols, self.dtype)
+            self._values.flags.writeable = False
+        return self._values
+
+    @property
+    def is_expandable(self) -> bool:
+        """Can columns be added to the table without specifying an index?
+        """
+        return self._is_expandable
 
     @property
     def has_data(self) -> bool:
         """Has any data been added to the table?
         """
-        return self.values.size > 0
+        return any(c is not None for c in self._cols)
+
+    def column(self, idx: int) -> Optional[np.ndarray]:
+        """Get the values of one column in the table, None if it has not been added
+        """
+        return self._cols[idx]
 
     def add_column(self, name: str, val: np.ndarray, idx: Optional[int] = None) -> int:
         """Add one column of values to the Table
-        """
-        if type(val) is not np.ndarray:
-            val = np.asarray(val)
 
-        # Create new array to hold values if necessary
-        val_num_obs = len(val)
-        if not self.has_data:
-            self.values = np.full((val_num_obs, self.num_cols), np.nan)
+        The values are copied into the table, so that later changes to the given
+        array do not change the table.
+        """
+        return self._store_column(name, np.array(val, dtype=self.dtype), idx)
 
+    def _store_column(self, name: str, val: np.ndarray, idx: Optional[int]) -> int:
+        """Store one column of values owned by the Table, without copying it
+        """
         # Add value to table at specified index
         if idx is None:
             if self._is_expandable:
-                idx = self.values.shape[1] or 0
-                self.values = np.concatenate((self.values, val[:, None]), axis=1)
+                idx = self.num_cols
+                self._cols.append(val)
                 self.col_names.append(name)
                 self.num_cols += 1
             else:
                 raise ValueError(f"Table is not expandable, specify 'idx'")
         else:
-            self.values[:, idx] = val
+            self._cols[idx] = val
             self.col_names[idx] = name
 
+        self._values = None
         return idx
 
+    def add_columns(
+        self,
+        names: List[str],
+        vals: np.ndarray,
+        idxs: Optional[List[Optional[int]]] = None,
+    ) -> List[int]:
+        """Add several columns of values to the Table
+
+        The values are given as a 2D array with one column for each name. The array
+        is copied into column major order once, so that each column is stored as a
+        contiguous view into the copy.
+        """
+        vals = np.array(vals, dtype=self.dtype, order="F")
+        if vals.ndim != 2 or vals.shape[1] != len(names):
+            raise ValueError(f"Expected values with {len(names)} columns")
+
+        idxs = idxs or [None] * len(names)
+        return [
+            self._store_column(name, vals[:, col], idx)
+            for col, (name, idx) in enumerate(zip(names, idxs))
+        ]
+
     def __repr__(self) -> str:
         """A simple string representation of the Table
         """
-        if self.values is None:
+        num_obs = next((len(c) for c in self._cols if c is not None), None)
+        if num_obs is None:
             return f"{self.__class__.__name__}()"
         else:
-            return f"{self.__class__.__name__}({self.values.shape})"
+            return f"{self.__class__.__name__}({(num_obs, self.num_cols)})"
@@ -33,34 +33,57 @@ A plug-in may be called using :func:`call`::
     <result from reader_one>
 
 Arguments to the plug-ins should be passed as named arguments to :func:`call`.
+
+To call a plug-in many times, look it up once using :func:`prebound`::
+
+    > reader_one = plugins.prebound('posetta.readers', 'reader_one')
+    > [reader_one(arg_to_plugin=arg) for arg in args]
 """
 
 # Standard library imports
-from collections import namedtuple
+import collections
+import functools
 import importlib
+import os
 import pathlib
-import re
 import sys
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, DefaultDict, Dict, Set, Tuple
 
 # Posetta imports
 from posetta.lib import exceptions
 
 
 # Simple structure containing information about a plug-in
-Plugin = namedtuple("Plugin", ["name", "function", "doc"])
-Plugin.__doc__ = """Information about a plug-in
+class Plugin:
+    """Information about a plug-in
 
-    Args:
+    Attributes:
         name: str        - Name of the plug-in.
         function:        - The plug-in.
         doc: str         - Doc string of the plug-in (module)
     """
 
+    __slots__ = ("name", "function", "doc")
+
+    def __init__(self, name: str, function: Callable, doc: str) -> None:
+        self.name = name
+        self.function = function
+        self.doc = doc
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r}, function={self.function!r})"
+
 
 # The _PLUGINS-dict is populated by the :func:`register` decorator in each
 # module.
-_PLUGINS: Dict[str, Dict[str, Plugin]] = dict()
+_PLUGINS: DefaultDict[str, Dict[str, Plugin]] = collections.defaultdict(dict)
+
+# Packages where all plug-ins have been imported, and the directories of packages
+_FULLY_IMPORTED: Set[str] = set()
+_PKG_DIRS: Dict[str, pathlib.Path] = dict()
+
+# Headers in doc-strings starting the development details of plug-ins
+_DETAIL_HEADERS = ("Args:", "Returns:", "Details:", "Attributes:")
 
 
 #
@@ -82,15 +105,32 @@ def register(func: Callable) -> Callable:
     """
     # Get information from the function being registered
     package_name, _, plugin_name = func.__module__.rpartition(".")
-    doc = sys.modules[func.__module__].__doc__
-    plugin = Plugin(plugin_name, func, doc or "")
+    try:
+        module_doc = func.__globals__["__doc__"]  # type: ignore
+    except (AttributeError, KeyError):  # Classes do not have __globals__
+        module_doc = sys.modules[func.__module__].__doc__
+    plugin = Plugin(plugin_name, func, module_doc or "")
 
     # Store Plugin-object in _PLUGINS dictionary
-    _PLUGINS.setdefault(package_name, dict())[plugin_name] = plugin
+    _PLUGINS[package_name][plugin_name] = plugin
+    _invalidate()
 
     return func
 
 
+def _invalidate() -> None:
+    """Clear all cached plug-in lookups
+
+    Called whenever a plug-in is registered, so that lookups never return stale
+    plug-ins.
+    """
+    _resolve.cache_clear()
+    prebound.cache_clear()
+    doc.cache_clear()
+    list_all.cache_clear()
+    exists.cache_clear()
+
+
 #
 # CALL PLUG-INS
 #
@@ -107,16 +147,31 @@ def call(package_name: str, plugin_name: str, **plugin_args: Any) -> Any:
     Returns:
         Return value of the plug-in.
     """
-    # Get Plugin-object
-    plugin = load(package_name, plugin_name)
+    return prebound(package_name, plugin_name)(**plugin_args)
 
-    # Call plug-in
-    return plugin.function(**plugin_args)
+
+@functools.lru_cache(maxsize=None)
+def prebound(package_name: str, plugin_name: str) -> Callable:
+    """Get a plug-in that can be called directly
+
+    Use this instead of :func:`call` to look up a plug-in once before calling it
+    many times, for instance in a loop. If the plug-in is not part of the package an
+    UnknownPluginError is raised.
+
+    Args:
+        package_name:  Name of package containing plug-ins.
+        plugin_name:   Name of the plug-in (module).
+
+    Returns:
+        The plug-in.
+    """
+    return _resolve(package_name, plugin_name).function
 
 
 #
 # GET DOCUMENTATION FOR PLUG-INS
 #
+@functools.lru_cache(maxsize=256)
 def doc(
     package_name: str,
     plugin_name: str,
@@ -126,7 +181,8 @@ def doc(
     """Document one plug-in
 
     Documentation is taken from the module doc-string. If the plug-in is not part of the
-    package an UnknownPluginError is raised.
+    package an UnknownPluginError is raised. The documentation is cached until a new
+    plug-in is registered.
 
     Args:
         package_name:     Name of package containing plug-ins.
@@ -147,11 +203,10 @@ def doc(
         # Stop before Args:, Returns: etc if details should not be included
         idx_args = len(lines)
         if not include_details:
-            re_args = re.compile("(Args:|Returns:|Details:|Attributes:)$")
-            try:
-                idx_args = [re_args.match(l) is not None for l in lines].index(True)
-            except ValueError:
-                pass
+            for idx, line in enumerate(lines):
+                if line in _DETAIL_HEADERS:
+                    idx_args = idx
+                    break
         return "\n".join(lines[:idx_args]).strip()
 
     else:
@@ -162,11 +217,13 @@ def doc(
 #
 # LIST AVAILABLE PLUG-INS
 #
+@functools.lru_cache(maxsize=None)
 def list_all(package_name: str) -> Tuple[str, ...]:
     """List all plug-ins in a package
 
     Lists all available plug-ins in the package.  Do note, however, that this
-    will import all python files in the package.
+    will import all python files in the package. The list is cached until a new
+    plug-in is registered.
 
     Args:
         package_name:  Name of package containing plug-ins.
@@ -178,15 +235,17 @@ def list_all(package_name: str) -> Tuple[str, ...]:
     _import_all(package_name)
 
     # Figure out names of plug-ins
-    plugin_names = _PLUGINS.get(package_name, dict()).keys()
+    plugin_names = _PLUGINS.get(package_name, ())
 
     return tuple(sorted(plugin_names))
 
 
+@functools.lru_cache(maxsize=None)
 def exists(package_name: str, plugin_name: str) -> bool:
     """Check whether or not a plug-in exists in a package
 
-    Tries to import the given plug-in.
+    Tries to import the given plug-in. The answer is cached until a new plug-in is
+    registered, so that missing plug-ins are not searched for again and again.
 
     Args:
         package_name:  Name of package containing plug-ins.
@@ -195,13 +254,13 @@ def exists(package_name: str, plugin_name: str) -> bool:
     Returns:
         True if plug-in exists, False otherwise.
     """
-    if plugin_name not in _PLUGINS.get(package_name, dict()):
+    if plugin_name not in _PLUGINS.get(package_name, ()):
         try:
             _import_one(package_name, plugin_name)
         except exceptions.UnknownPluginError:
             return False
 
-    return plugin_name in _PLUGINS.get(package_name, dict())
+    return plugin_name in _PLUGINS.get(package_name, ())
 
 
 #
@@ -219,7 +278,24 @@ def load(package_name: str, plugin_name: str) -> Plugin:
     Returns:
         Name of plug-in.
     """
-    if plugin_name not in _PLUGINS.get(package_name, dict()):
+    return _resolve(package_name, plugin_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve(package_name: str, plugin_name: str) -> Plugin:
+    """Look up one plug-in, importing it if necessary
+
+    Plug-ins that are found are cached, so that repeated lookups are fast. The cache
+    is cleared by :func:`register`.
+
+    Args:
+        package_name:  Name of package containing plug-ins.
+        plugin_name:   Name of the plug-in (module).
+
+    Returns:
+        Plugin-object with information about the plug-in.
+    """
+    if plugin_name not in _PLUGINS.get(package_name, ()):
         _import_one(package_name, plugin_name)
 
     try:
@@ -253,29 +329,55 @@ def _import_all(package_name: str) -> None:
     """Import all .py-files in the given package directory
 
     As each file is imported, the _PLUGINS-dict will be populated by @register
-    decorated functions in each file.
+    decorated functions in each file. Plug-ins that are already registered are not
+    imported again, and packages are only scanned the first time they are used.
 
     Files with names starting with an underscore are not imported.
 
     Args:
         package_name:  Name of package containing plug-ins.
     """
-    # Figure out the directory of the package by importing it. The package must contain
-    # __init__.py for this to work, as otherwise __file__ is not set.
-    try:
-        package = importlib.import_module(package_name)
-    except ImportError:
-        msg = f"Plug-in package '{package_name}' not found"
-        raise exceptions.UnknownPackageError(msg) from None
-
-    try:
-        directory = pathlib.Path(package.__file__).parent
-    except AttributeError:
-        msg = f"Plug-in package '{package_name}' must include '__init__.py'"
-        raise exceptions.UnknownPluginError(msg) from None
+    if package_name in _FULLY_IMPORTED:
+        return
 
     # Import all .py files in the given directory
-    for file_path in directory.glob("*.py"):
-        plugin_name = file_path.stem
-        if not plugin_name.startswith("_"):
-            _import_one(package_name, plugin_name)
+    directory = _package_directory(package_name)
+    registered = _PLUGINS[package_name]
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".py") or name.startswith("_"):
+                continue
+            plugin_name = name[:-3]
+            if plugin_name not in registered and entry.is_file():
+                _import_one(package_name, plugin_name)
+
+    _FULLY_IMPORTED.add(package_name)
+
+
+def _package_directory(package_name: str) -> pathlib.Path:
+    """Find the directory of a package
+
+    The directory is found by importing the package. The package must contain
+    __init__.py for this to work, as otherwise __file__ is not set.
+
+    Args:
+        package_name:  Name of package containing plug-ins.
+
+    Returns:
+        Path to the directory of the package.
+    """
+    if package_name not in _PKG_DIRS:
+        try:
+            package = importlib.import_module(package_name)
+        except ImportError:
+            msg = f"Plug-in package '{package_name}' not found"
+            raise exceptions.UnknownPackageError(msg) from None
+
+        try:
+            _PKG_DIRS[package_name] = pathlib.Path(package.__file__).parent
+        except (AttributeError, TypeError):
+            msg = f"Plug-in package '{package_name}' must include '__init__.py'"
+            raise exceptions.UnknownPluginError(msg) from None
+
+    return _PKG_DIRS[package_name]
@@ -5,16 +5,21 @@ Description:
 
 To add a new reader, simply create a new .py-file which defines a class
 inheriting from `posetta.readers._reader.Reader` or one of its subclasses. The
-class must be decorated with the `posetta.lib.plugins.register` decorator as
-follows:
+class is registered as a plug-in automatically when it is defined:
 
     from posetta.readers import _reader
-    from posetta.lib import plugins
 
-    @plugins.register
     class MyNewFormat(_reader.Reader):
         ...
 
+Classes defined in modules with names starting with an underscore, like the
+base classes, and classes with names starting with an underscore are not
+registered. Each module may register only one reader, so other helper base
+classes in the module must be defined with `register=False`:
+
+    class MyBaseReader(_reader.Reader, register=False):
+        ...
+
 To use a reader, call it using one of the read-functions defined below:
 
     from posetta import readers
@@ -27,7 +32,8 @@ or
         data = readers.read_stream(input_stream, "my_new_format", ...)
 
 Note that the stream should be opened as a binary stream to allow the readers
-to handle encodings if necessary.
+to handle encodings if necessary. By default, `read_file` memory maps the file
+and passes the mapped file to the reader as the input stream.
 
 
 The name used in `read_file` and `read_stream` to call the reader is the name
@@ -35,15 +41,53 @@ of the module (file) containing the reader.
 
 """
 
+from __future__ import annotations
+
 # Standard library imports
+import contextlib
+import importlib
+import mmap
 import pathlib
-from typing import Any, IO, List, Optional, Tuple, Union
+from typing import Any, IO, Iterator, List, Optional, Tuple, TYPE_CHECKING, Union
 
 # Posetta imports
-from posetta.readers._reader import Reader
 from posetta.lib import exceptions
 from posetta.lib import plugins
 
+if TYPE_CHECKING:
+    from posetta.readers._reader import Reader  # Imported in __getattr__ when needed
+
+__all__ = [
+    "Reader",
+    "names",
+    "exists",
+    "short_docs",
+    "read_stream",
+    "read_file",
+    "identify",
+]
+
+# Attributes that are imported the first time they are used, given as module names
+_LAZY_ATTRIBUTES = {"Reader": "posetta.readers._reader"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import attributes of the package the first time they are used
+
+    Args:
+        name:  Name of attribute.
+
+    Returns:
+        Value of attribute.
+    """
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = globals()[name] = getattr(importlib.import_module(module_name), name)
+    return value
+
 
 def names() -> Tuple[str, ...]:
     """List the names of available readers
@@ -117,6 +161,7 @@ def read_stream(
 def read_file(
     file_path: Union[str, pathlib.Path],
     reader_name: Optional[str] = None,
+    use_mmap: bool = True,
     **reader_args: Any,
 ) -> Reader:
     """Read a file with a given reader
@@ -128,12 +173,62 @@ def read_file(
     Args:
         file_path:    Path to file that should be read.
         reader_name:  Name of reader that should be used.
+        use_mmap:     Memory map the file instead of reading it through a buffer.
 
     Returns:
         Data in file.
     """
+    open_file = _open_mapped if use_mmap else _open_buffered
+    with open_file(file_path) as input_stream:
+        return read_stream(input_stream, reader_name, **reader_args)
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only memory map of a file, with the file name available as `name`
+    """
+
+    name: str
+
+
+@contextlib.contextmanager
+def _open_buffered(file_path: Union[str, pathlib.Path]) -> Iterator[IO[bytes]]:
+    """Open a file as a regular buffered binary stream
+
+    Args:
+        file_path:    Path to file that should be opened.
+
+    Returns:
+        Context manager giving the opened file.
+    """
     with open(file_path, mode="rb") as input_stream:
-        return read_stream(input_stream, reader_name)
+        yield input_stream
+
+
+@contextlib.contextmanager
+def _open_mapped(file_path: Union[str, pathlib.Path]) -> Iterator[IO[bytes]]:
+    """Open a file as a read-only memory map
+
+    Files that can not be memory mapped, like empty files and pipes, are opened as
+    regular buffered streams instead.
+
+    Args:
+        file_path:    Path to file that should be opened.
+
+    Returns:
+        Context manager giving the memory mapped file.
+    """
+    with open(file_path, mode="rb") as input_stream:
+        try:
+            mapped = _MappedFile(input_stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            yield input_stream
+            return
+
+        with mapped:
+            mapped.name = input_stream.name
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield mapped  # type: ignore
 
 
 def identify(input_stream: IO[bytes]) -> str:
@@ -142,16 +237,10 @@ def identify(input_stream: IO[bytes]) -> str:
     A NoReaderFound error is raised if no such appropriate reader is found.
 
     Args:
-        file_path:    Path to file that should be identified.
+        input_stream:  Stream of bytes that should be identified.
 
     Returns:
-        Name of reader that can read the given file.
+        Name of reader that can read the given stream.
     """
-    import IPython
-
-    where_am_i = "readers.__init__.identify"
-    IPython.embed()
-
-    raise exceptions.NoReaderFound(
-        f"Found no reader that can read {input_stream.name}"
-    ) from None
+    name = getattr(input_stream, "name", "<unknown>")
+    raise exceptions.NoReaderFound(f"Found no reader that can read {name}")
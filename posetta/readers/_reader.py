@@ -7,15 +7,26 @@ This module contains an abstract base class that can be extended for reading dat
 in Posetta.
 """
 
+from __future__ import annotations
+
 # Standard library imports
-import codecs
-from typing import Any, Dict, IO, List, Union
+import io
+import mmap
+import types
+from typing import Any, Dict, IO, List, Mapping, TYPE_CHECKING, Union
 
 # Third party imports
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd  # Pandas is imported in as_dataframe when needed
 
 # Posetta imports
 from posetta import data
+from posetta.lib import exceptions
+from posetta.lib import plugins
+
+
+# Names of the reader classes registered from each module
+_REGISTERED_READERS: Dict[str, str] = dict()
 
 
 class Reader:
@@ -25,8 +36,17 @@ class Reader:
     inherit from one of the specific readers like for instance
     ChainReader, LineReader, SinexReader etc
 
+    Subclasses are registered as reader plug-ins when they are defined, named by
+    the module that defines them. Each module may register only one reader.
+    Subclasses in private modules (starting with an underscore) and private
+    subclasses are not registered. Other helper base classes must opt out
+    explicitly::
+
+        class MyBaseReader(Reader, register=False):
+            ...
+
     Attributes:
-        input_stream: IO[str]    - Stream that input is read from.
+        input_stream: IO[bytes]  - Byte stream that input is read from.
         reader_name: str         - Name of the reader (module).
         data: Dict[str, Any]     - The coordinate data read from file.
         meta: Dict[str, Any]     - Metainformation read from file.
@@ -35,6 +55,37 @@ class Reader:
 
     """
 
+    reader_name = "_reader"
+
+    def __init_subclass__(cls, register: bool = True, **kwargs: Any) -> None:
+        """Set the reader name and register subclasses as reader plug-ins
+
+        The reader name is the name of the module defining the subclass. Subclasses
+        defined in private modules, like the base classes in this package, private
+        subclasses and subclasses defined with `register=False` are not registered.
+
+        A ReaderError is raised if a module tries to register a second reader, so
+        that one reader does not silently replace another.
+
+        Args:
+            register:  Whether the subclass should be registered as a plug-in.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.reader_name = cls.__module__.rpartition(".")[-1]
+        is_private = cls.__name__.startswith("_") or cls.reader_name.startswith("_")
+        if not register or is_private:
+            return
+
+        # The same class may be registered again, for instance if its module is
+        # reloaded, but not a different class in the same module
+        other = _REGISTERED_READERS.setdefault(cls.__module__, cls.__qualname__)
+        if other != cls.__qualname__:
+            raise exceptions.ReaderError(
+                f"Module '{cls.__module__}' defines more than one reader: {other} and "
+                f"{cls.__qualname__}. Define helper base classes with register=False"
+            )
+        plugins.register(cls)
+
     def __init__(self, input_stream: IO[bytes], encoding: str = "utf-8") -> None:
         """Set up the basic information needed by the reader
 
@@ -42,9 +93,8 @@ class Reader:
             input_stream:  Byte stream that will be read.
             encoding:      Encoding of input stream.
         """
-        self.input_stream = codecs.getreader(encoding)(input_stream)
+        self.input_stream = input_stream
         self.encoding = encoding
-        self.reader_name = self.__module__.split(".")[-1]
 
         try:
             self.file_path = input_stream.name
@@ -59,6 +109,23 @@ class Reader:
         )
         self.data: Dict[str, Any] = dict()
 
+    def read_text(self) -> str:
+        """Read the rest of the input stream and decode it as text in one go
+
+        Memory mapped input is decoded directly from the mapped memory, without first
+        copying it into a bytes object.
+
+        Returns:
+            The decoded text.
+        """
+        if not isinstance(self.input_stream, mmap.mmap):
+            return str(self.input_stream.read(), self.encoding)
+
+        pos = self.input_stream.tell()
+        self.input_stream.seek(0, io.SEEK_END)
+        with memoryview(self.input_stream) as view, view[pos:] as rest:
+            return str(rest, self.encoding)
+
     def setup_reader(self) -> None:
         """Set up a reader so that it can read data from a file.
 
@@ -82,22 +149,27 @@ class Reader:
     def read_data(self) -> None:
         """Read data from the data file
 
-        Data should be read from `self.input_stream` and stored in the
-        dictionary `self.data`. A description of the data may be placed
-        in the dictionary `self.meta`.
+        Data should be read from `self.input_stream`, for instance using
+        `read_text`, and stored in the dictionary `self.data`. A description of the data
+        may be placed in the dictionary `self.meta`.
         """
         raise NotImplementedError(f"{self.reader_name} must implement read_data()")
 
-    def as_dict(self, include_meta: bool = False) -> Dict[str, Any]:
-        """Return the data as a dictionary
+    def as_dict(self, include_meta: bool = False) -> Mapping[str, Any]:
+        """Return the data as a read-only dictionary
+
+        The data are not copied. Use `dict(reader.as_dict())` to get a dictionary that
+        can be changed.
 
         Args:
             include_meta:   Include meta-data in the returned dict?
 
         Returns:
-            The data that has been read as a dictionary.
+            The data that has been read as a read-only dictionary.
         """
-        return dict(self.data, __meta__=self.meta) if include_meta else self.data.copy()
+        if include_meta:
+            return types.MappingProxyType(dict(self.data, __meta__=self.meta))
+        return types.MappingProxyType(self.data)
 
     def as_dataframe(self, index: Union[None, str, List[str]] = None) -> pd.DataFrame:
         """Return the data as a Pandas DataFrame
@@ -113,6 +185,8 @@ class Reader:
             The data that has been read as a DataFrame.
 
         """
+        import pandas as pd
+
         df = pd.DataFrame.from_dict(self.data)
         if index is not None:
             df.set_index(index, drop=True, inplace=True)
@@ -7,17 +7,42 @@ Read file formats that contain data in nicely formatted columns in text
 files.
 """
 
+from __future__ import annotations
+
 # Standard library imports
+import io
+import itertools
 import pathlib
-from typing import IO
+from typing import Any, Dict, IO, List, Optional, Tuple, TYPE_CHECKING, Union
 
 # Third party imports
 import numpy as np
+from numpy.lib import recfunctions
+
+if TYPE_CHECKING:
+    import pandas as pd  # Pandas is imported in as_dataframe when needed
 
 # Posetta imports
 from posetta.lib import exceptions
 from posetta.readers._reader import Reader
 
+# Parameters to np.genfromtxt that are understood by np.loadtxt, with their names in
+# np.loadtxt. The names parameter is handled separately.
+_LOADTXT_PARAMS = dict(
+    comments="comments",
+    delimiter="delimiter",
+    dtype="dtype",
+    encoding="encoding",
+    max_rows="max_rows",
+    ndmin="ndmin",
+    skip_header="skiprows",
+    unpack="unpack",
+    usecols="usecols",
+)
+
+# Names that np.genfromtxt changes when used as column names
+_RESERVED_NAMES = ("return", "file", "print")
+
 
 class LineReader(Reader):
     """An abstract base class with basic methods for reading a datafile
@@ -27,10 +52,14 @@ class LineReader(Reader):
     parameters in `setup_reader`.
     """
 
+    _use_genfromtxt = False
+
     def __init__(self, input_stream: IO[bytes], encoding: str = "utf-8") -> None:
         """Set up the basic information needed by the Reader
 
-        Add a self._array property for the raw numpy array data.
+        Add a self._array property for the raw numpy array data, a self._columns
+        property for numeric data stored as one 2D array, and a self._column_names
+        property with the names of the columns in self._columns.
 
         Args:
             input_stream:    Byte stream that will be read.
@@ -38,6 +67,8 @@ class LineReader(Reader):
         """
         super().__init__(input_stream, encoding)
         self._array = None
+        self._columns: Optional[np.ndarray] = None
+        self._column_names: List[str] = list()
 
     def setup_reader(self) -> None:
         """Set up information needed for the reader
@@ -55,13 +86,30 @@ class LineReader(Reader):
         parameters should be returned by `setup_reader`. See
         `self.structure_data` if the self.data-dictionary needs to be
         structured in a particular way.
+
+        Files are read with the faster np.loadtxt-function when the parameters
+        allow it. If np.loadtxt fails, for instance because of missing values,
+        np.genfromtxt is used instead. Set `_use_genfromtxt` to True in
+        subclasses that should always use np.genfromtxt.
         """
         if "__params__" not in self.meta:
             raise exceptions.ReaderError(
                 f"{self.__class__.__name__} is not properly set up."
             )
 
-        self._array = np.genfromtxt(self.input_stream, **self.meta["__params__"])
+        params = self.meta["__params__"]
+        text = self.read_text()
+        loadtxt_params = None
+        if not self._use_genfromtxt:
+            loadtxt_params = _as_loadtxt_params(params, text)
+
+        if loadtxt_params is not None:
+            try:
+                self._array = np.loadtxt(io.StringIO(text), **loadtxt_params)
+            except ValueError:
+                loadtxt_params = None
+        if loadtxt_params is None:
+            self._array = np.genfromtxt(io.StringIO(text), **params)
         self.structure_data()
 
     def structure_data(self) -> None:
@@ -69,11 +117,121 @@ class LineReader(Reader):
 
         This simple implementation creates a dictionary with one item per
         column in the array. Override this method for more complex use cases.
+
+        If all columns have the same numeric dtype, they are stored in one 2D array in
+        column major order, and the items in the dictionary are views into it.
         """
         if self._array is None:
             raise exceptions.ReaderError(
                 f"No data found in {type(self)}. Have you called read_data() yet?"
             )
 
-        for name in self._array.dtype.names:
-            self.data[name] = self._array[name]
+        names = self._array.dtype.names
+        dtypes = {self._array.dtype[name] for name in names}
+        if len(dtypes) == 1 and dtypes.pop().kind in "fiu":
+            array = np.atleast_1d(self._array)
+            self._columns = np.asfortranarray(
+                recfunctions.structured_to_unstructured(array)
+            )
+            self._column_names = list(names)
+            for idx, name in enumerate(self._column_names):
+                self.data[name] = self._columns[:, idx]
+        else:
+            for name in names:
+                self.data[name] = self._array[name]
+
+    def as_dataframe(self, index: Union[None, str, List[str]] = None) -> pd.DataFrame:
+        """Return the data as a Pandas DataFrame
+
+        Numeric data stored as one 2D array are passed to Pandas as one block.
+
+        Args:
+            index:      Name of field to use as index. May also be a list of strings.
+
+        Returns:
+            The data that has been read as a DataFrame.
+        """
+        if self._columns is None or len(self._column_names) != len(self.data):
+            return super().as_dataframe(index=index)
+
+        import pandas as pd
+
+        df = pd.DataFrame(self._columns, columns=self._column_names)
+        if index is not None:
+            df.set_index(index, drop=True, inplace=True)
+
+        return df
+
+
+def _as_loadtxt_params(params: Dict[str, Any], text: str) -> Optional[Dict[str, Any]]:
+    """Translate parameters for np.genfromtxt to parameters for np.loadtxt
+
+    Names read from the header of the file are translated to a structured dtype, as
+    long as np.genfromtxt would not change them.
+
+    Args:
+        params:  Parameters for np.genfromtxt.
+        text:    Text that will be read.
+
+    Returns:
+        Parameters for np.loadtxt, or None if np.loadtxt does not support the
+        parameters, for instance for inferred dtypes or masked values.
+    """
+    dtype = params.get("dtype", float)
+    names = params.get("names")
+    if dtype is None or any(p not in _LOADTXT_PARAMS for p in params if p != "names"):
+        return None
+    if names:
+        try:
+            if np.dtype(dtype).names is not None:
+                return None
+        except TypeError:
+            return None
+
+    loadtxt_params = {_LOADTXT_PARAMS[p]: v for p, v in params.items() if p != "names"}
+    if names is True:
+        if "usecols" in params:
+            return None
+        names, loadtxt_params["skiprows"] = _read_header(text, params)
+        if names is None:
+            return None
+    elif isinstance(names, str):
+        names = [n.strip() for n in names.split(",")]
+    if names:
+        loadtxt_params["dtype"] = [(name, dtype) for name in names]
+
+    return loadtxt_params
+
+
+def _read_header(text: str, params: Dict[str, Any]) -> Tuple[Optional[List[str]], int]:
+    """Read column names from the header of a text, like np.genfromtxt(names=True)
+
+    The header is the first non-empty line after the skipped lines. If the header
+    contains a comment, the names are read from the comment.
+
+    Args:
+        text:    Text that will be read.
+        params:  Parameters for np.genfromtxt.
+
+    Returns:
+        Names of columns and number of lines up to and including the header. Names
+        are None if np.genfromtxt would change them.
+    """
+    comments = params.get("comments", "#")
+    num_lines = params.get("skip_header", 0)
+    for line in itertools.islice(io.StringIO(text), num_lines, None):
+        num_lines += 1
+        if comments and comments in line:
+            line = line.split(comments, 1)[1]
+        if line.strip():
+            break
+    else:
+        return None, 0
+
+    names = [n.strip() for n in line.split(params.get("delimiter"))]
+    if len(set(names)) < len(names):
+        return None, 0
+    if not all(n.isidentifier() and n not in _RESERVED_NAMES for n in names):
+        return None, 0
+
+    return names, num_lines
@@ -1,4 +1,4 @@
-"""Loosely formatted coordinate files from KMS
+r"""Loosely formatted coordinate files from KMS
 
 Description:
 ------------
@@ -17,13 +17,21 @@ Example files:
 import re
 from typing import IO
 
+# Third party imports
+import numpy as np
+
 # Posetta imports
 from posetta import data
-from posetta.lib import plugins
 from posetta.readers._reader_line import Reader
 
+# Regular expressions used for tokenizing KMS files, compiled once
+_COMMENT_BLOCK = re.compile(r"\*.*?;", flags=re.DOTALL)
+_TRAILING_SPACE = re.compile(r"\s+\n", flags=re.MULTILINE)
+_COLUMN_SEPARATOR = re.compile("  +")
+_NUMBER = re.compile(r"[-+]?\d*\.\d+|\d+")
+_LAST_CHARACTER = re.compile(r"\w$")
+
 
-@plugins.register
 class KmsReader(Reader):
     """A reader for KMS files
     """
@@ -58,15 +66,24 @@ class KmsReader(Reader):
         """
         Read KMS coordinate file.
         """
-        text = self.input_stream.read()
-        text = re.sub(r"\*.*?;", "", text, flags=re.DOTALL)  # Remove comment lines
-        text = re.sub(r"\s+\n", "\n", text, flags=re.MULTILINE)  # Remove empty lines
+        text = self.read_text()
+        text = _COMMENT_BLOCK.sub("", text)  # Remove comment lines
+        text = _TRAILING_SPACE.sub("\n", text)  # Remove empty lines
         lines = text.split("\n")
 
+        # Bind the append methods of the data lists once, outside the loop
+        append_comment = self.data["comment"].append
+        append_minilabel = self.data["minilabel"].append
+        append_station = self.data["station"].append
+        append_easting = self.data["easting"].append
+        append_northing = self.data["northing"].append
+        append_elevation = self.data["elevation"].append
+
         for line in lines:
-            if line[0:17].strip().startswith("#"):
+            label = line[0:17].strip()
+            if label.startswith("#"):
                 kms_label = line.strip()
-            elif line[0:17].strip().startswith("-1z"):
+            elif label.startswith("-1z"):
                 kms_label = ""
             else:
                 northing = None
@@ -78,7 +95,7 @@ class KmsReader(Reader):
 
                 station_id = line[0:18].replace(" ", "")
                 # station_descr = line[18:21].replace(" ", "")
-                cols = re.split("  +", line[21:].strip())
+                cols = _COLUMN_SEPARATOR.split(line[21:].strip())
                 if len(cols) == 1 and cols[0] == "":
                     continue
 
@@ -86,17 +103,18 @@ class KmsReader(Reader):
                 for i, element in enumerate(cols):
                     value = None
                     unit = None
-                    if element.strip().endswith((" m", " dg", " rad")):
-                        value = "".join(element.strip().split(" ")[:-1])
-                        unit = element.strip().split(" ")[-1]
+                    element = element.strip()
+                    if element.endswith((" m", " dg", " rad")):
+                        *value_parts, unit = element.split(" ")
+                        value = "".join(value_parts)
 
-                    if element.strip().endswith(("\dm", "\ddg", "\drad")):
-                        value = re.findall(r"[-+]?\d*\.\d+|\d+", element.strip())[0]
-                        unit = re.findall(r"\w$", element.strip())[0]
+                    if element.endswith((r"\dm", r"\ddg", r"\drad")):
+                        value = _NUMBER.findall(element)[0]
+                        unit = _LAST_CHARACTER.findall(element)[0]
 
-                    if element.strip().endswith((" sx", " nt")):
-                        value = element.strip()
-                        unit = element.strip().split(" ")[-1]
+                    if element.endswith((" sx", " nt")):
+                        value = element
+                        unit = element.split(" ")[-1]
 
                     if value is not None:
                         elements.append(float(value))
@@ -117,15 +135,20 @@ class KmsReader(Reader):
                     elevation = elements[0]
 
                 if len(elements) > 0:
-                    self.data["comment"].append(" ".join(cols[len(elements):]))
-                    self.data["minilabel"].append(kms_label)
-                    self.data["station"].append(station_id)
+                    append_comment(" ".join(cols[len(elements):]))
+                    append_minilabel(kms_label)
+                    append_station(station_id)
                     if easting is not None:
-                        self.data["easting"].append(easting)
+                        append_easting(easting)
                     if northing is not None:
-                        self.data["northing"].append(northing)
+                        append_northing(northing)
                     if elevation is not None:
-                        self.data["elevation"].append(elevation)
+                        append_elevation(elevation)
+
+        # Store coordinates as arrays of floats instead of lists of Python floats
+        for field in ("easting", "northing", "elevation"):
+            values = self.data[field]
+            self.data[field] = np.fromiter(values, dtype=np.float64, count=len(values))
 
     def as_coordset(self) -> data.CoordSet:
         """Return the data as a coordinate dataset
@@ -135,20 +158,15 @@ class KmsReader(Reader):
         """
         cset = data.CoordSet()
 
-        # add coordinates
-        if all(v is not None for v in self.data["easting"]):
-            cset.add("positions", self.data["easting"], 0, "easting")
-        if all(v is not None for v in self.data["northing"]):
-            cset.add("positions", self.data["northing"], 1, "northing")
-        if all(v is not None for v in self.data["elevation"]):
-            cset.add("positions", self.data["elevation"], 2, "elevation")
+        # add coordinates, read_data only stores complete coordinates so no values
+        # are missing
+        cset.add("positions", self.data["easting"], 0, "easting")
+        cset.add("positions", self.data["northing"], 1, "northing")
+        cset.add("positions", self.data["elevation"], 2, "elevation")
 
         # add whatever metadata is available
-        if all(v is not None for v in self.data["station"]):
-            cset.add("values", self.data["station"], None, "station")
-        if all(v is not None for v in self.data["minilabel"]):
-            cset.add("values", self.data["minilabel"], None, "minilabel")
-        if all(v is not None for v in self.data["comment"]):
-            cset.add("values", self.data["comment"], None, "comment")
+        cset.add("values", self.data["station"], None, "station")
+        cset.add("values", self.data["minilabel"], None, "minilabel")
+        cset.add("values", self.data["comment"], None, "comment")
 
         return cset
@@ -33,11 +33,10 @@ http://www.gdal.org/frmt_xyz.html
 
 # Posetta imports
 from posetta import data
-from posetta.lib import plugins
+from posetta.lib import exceptions
 from posetta.readers._reader_line import LineReader
 
 
-@plugins.register
 class XyzReader(LineReader):
     """A reader for xyz-files
     """
@@ -59,11 +58,21 @@ class XyzReader(LineReader):
     def as_coordset(self) -> data.CoordSet:
         """Return the data as a coordinate dataset
 
+        All columns in an xyz-file are numbers, so they are passed to the CoordSet as
+        the 2D float array built by `structure_data`, named by the same list of names
+        as the columns in `self.data`.
+
         Returns:
             The data that has been read as a coordinate dataset.
         """
-        cset = data.CoordSet()
-        for column, value in self.data.items():
-            table, idx = self._headers.get(column.lower(), ("values", None))
-            cset.add(table, val=value, idx=idx, column_name=column)
-        return cset
+        if self._columns is None:
+            raise exceptions.ReaderError(
+                f"No data found in {type(self)}. Have you called read_data() yet?"
+            )
+
+        column_names = self._column_names
+        column_specs = [
+            self._headers.get(column.lower(), ("values", None))
+            for column in column_names
+        ]
+        return data.CoordSet.from_matrix(self._columns, column_names, column_specs)
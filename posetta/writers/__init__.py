@@ -34,14 +34,18 @@ of the module (file) containing the writer.
 
 """
 
+from __future__ import annotations
+
 # Standard library imports
 import pathlib
-from typing import Any, IO, List, Tuple, Union
+from typing import Any, IO, List, Tuple, TYPE_CHECKING, Union
 
 # Posetta imports
-from posetta.data import CoordSet
 from posetta.lib import plugins
 
+if TYPE_CHECKING:
+    from posetta.data import CoordSet  # Only needed for type annotations
+
 
 def names() -> Tuple[str, ...]:
     """List the names of available writers
@@ -8,8 +8,9 @@ in Posetta.
 """
 
 # Standard library imports
-import codecs
-from typing import IO
+import contextlib
+import io
+from typing import IO, Iterator
 
 # Third party imports
 
@@ -17,6 +18,9 @@ from typing import IO
 from posetta import data
 from posetta.lib import exceptions
 
+# Size of the buffer used when writing to the output stream
+_BUFFER_SIZE = 1 << 20
+
 
 class Writer:
     """An abstract base class that has basic methods for writing a datafile
@@ -25,7 +29,7 @@ class Writer:
     the specific writers like for instance ChainWriter, LineWriter, SinexWriter etc
 
     Attributes:
-        output_stream: IO[str]    - Stream that output is written to.
+        output_stream: IO[str]    - Text stream that output is written to.
         data: data.CoordSet       - The coordinate data to be written.
         writer_name: str          - Name of the writer (module).
         file_path: str            - Name of the datafile that will be written.
@@ -42,7 +46,8 @@ class Writer:
             cset:           Data that will be written.
             encoding:       Encoding used when writing data.
         """
-        self.output_stream = codecs.getwriter(encoding)(output_stream)
+        self._byte_stream = output_stream
+        self.output_stream: IO[str]  # Text stream, only available during write()
         self.data = cset
         self.encoding = encoding
         self.writer_name = self.__module__.split(".")[-1]
@@ -67,11 +72,30 @@ class Writer:
 
         Subclasses should typically implement (at least) the `write_data`-method.
         """
-        self.setup_writer()
-        if self.data.num_obs:
-            self.write_data()
-        else:
-            raise exceptions.WriterError("Input dataset is empty")
+        with self._buffered_output():
+            self.setup_writer()
+            if self.data.num_obs:
+                self.write_data()
+            else:
+                raise exceptions.WriterError("Input dataset is empty")
+
+    @contextlib.contextmanager
+    def _buffered_output(self) -> Iterator[None]:
+        """Set up a buffered text stream that output is written to
+
+        Text written to `self.output_stream` is collected in a large buffer, and
+        encoded and written to the byte stream in large chunks. The byte stream is
+        flushed, but not closed, when writing is done. After that, the detached text
+        stream raises an error if it is written to.
+        """
+        buffer = io.BufferedWriter(self._byte_stream, buffer_size=_BUFFER_SIZE)
+        self.output_stream = io.TextIOWrapper(
+            buffer, encoding=self.encoding, newline=""
+        )
+        try:
+            yield
+        finally:
+            self.output_stream.detach().detach()
 
     def write_data(self) -> None:
         """Write data to the data file
@@ -33,12 +33,25 @@ TODO
 
 # Standard library imports
 import codecs
+import csv
+import os
+from typing import List
+
+# Third party imports
+import numpy as np
 
 # Posetta imports
 from posetta.lib import plugins
 from posetta.writers._writer import Writer
 
 
+# Number of rows passed to Pandas at a time
+_ROWS_PER_WRITE = 65_536
+
+# Datasets with fewer rows than this are written without importing Pandas
+_MAX_ROWS_WITHOUT_PANDAS = 256
+
+
 @plugins.register
 class CsvWriter(Writer):
     """A writer for csv-files
@@ -47,6 +60,62 @@ class CsvWriter(Writer):
     def write_data(self) -> None:
         """Write data to a CSV file
 
-        Use pandas to do the work
+        Use pandas to do the work. Small datasets are written with the csv module
+        instead, giving the same output without the cost of importing Pandas.
         """
-        self.data.as_dataframe().to_csv(self.output_stream)
+        if self.data.num_obs < _MAX_ROWS_WITHOUT_PANDAS:
+            self._write_rows()
+        else:
+            self._write_chunks()
+
+    def _write_chunks(self) -> None:
+        """Write data to a CSV file using Pandas
+
+        Rows are written in chunks, so that the full dataset is never copied into one
+        DataFrame.
+        """
+        import pandas as pd
+
+        num_obs = self.data.num_obs
+        columns = self.data.as_dict()
+        for start in range(0, num_obs, _ROWS_PER_WRITE):
+            stop = min(start + _ROWS_PER_WRITE, num_obs)
+            chunk = pd.DataFrame(
+                {c: v[start:stop] for c, v in columns.items()},
+                index=pd.RangeIndex(start, stop),
+            )
+            chunk.to_csv(self.output_stream, header=start == 0)
+
+    def _write_rows(self) -> None:
+        """Write data to a CSV file using the csv module
+
+        The output mimics DataFrame.to_csv: the first column is the row number, and
+        missing (NaN) values are written as empty fields.
+        """
+        columns = self.data.as_dict()
+        writer = csv.writer(self.output_stream, lineterminator=os.linesep)
+        writer.writerow(["", *columns])
+        writer.writerows(
+            zip(range(self.data.num_obs), *[_csv_column(c) for c in columns.values()])
+        )
+
+
+def _csv_column(values: np.ndarray) -> List[object]:
+    """Values of one column as they are written by Pandas
+
+    Args:
+        values:  Values in one column.
+
+    Returns:
+        Python objects that the csv module writes the same way as Pandas.
+    """
+    if values.dtype.kind != "f":
+        return values.tolist()
+
+    # Python floats are written like float64 values, other floats must be formatted
+    # by numpy, as for instance float32 values would otherwise get extra digits
+    if values.dtype == np.float64:
+        column = values.tolist()
+    else:
+        column = values.astype(str).tolist()
+    return ["" if is_nan else v for v, is_nan in zip(column, np.isnan(values))]
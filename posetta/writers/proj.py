@@ -11,11 +11,21 @@ extraneous data such as velocities and other generic values.
 
 """
 
+# Standard library imports
+from typing import Any, List
+
+# Third party imports
+import numpy as np
+
 # Posetta imports
+from posetta.data.coordset import Table
 from posetta.lib import exceptions
 from posetta.lib import plugins
 from posetta.writers._writer import Writer
 
+# Number of rows that are formatted and written to the output stream at a time
+_ROWS_PER_WRITE = 100_000
+
 
 @plugins.register
 class ProjWriter(Writer):
@@ -24,6 +34,9 @@ class ProjWriter(Writer):
 
     def write_data(self) -> None:
         """Write data to a text file in 'x y z t # comment' format.
+
+        Rows are formatted with one format string and written in large chunks,
+        instead of writing one value at a time.
         """
 
         # TODO: We can't do tests based on column names unless we standardize them
@@ -39,41 +52,64 @@ class ProjWriter(Writer):
         #         "Input dataset should at least contain eating and northing columns"
         #     )
 
-        for idx in range(self.data.num_obs):
-            # assume that position data is ordered as easting, northing, elevation
-            # (otherwise a PROJ axisswap operation can fix that).
-            for col_idx in range(self.data.tables["positions"].num_cols):
-                self.output_stream.write(
-                    "{val}\t".format(
-                        val=self.data.tables["positions"].values[idx][col_idx]
-                    )
-                )
-
-            # write epochs if they are present
-            if self.data.tables["epochs"].has_data:
-                self.output_stream.write(
-                    "{val}\t".format(val=self.data.tables["epochs"].values[idx][0])
-                )
-
-            # everything from here is considered a comment by PROJ
-            self.output_stream.write("#  ")
-
-            # write velocities if they are present
-            if self.data.tables["velocities"].has_data:
-                for col_idx in range(self.data.tables["velocities"].num_cols):
-                    self.output_stream.write(
-                        "{val}\t".format(
-                            val=self.data.tables["velocities"].values[idx][col_idx]
-                        )
-                    )
-
-            # write additional values if they are present
-            if self.data.tables["values"].has_data:
-                for col_idx in range(self.data.tables["values"].num_cols):
-                    self.output_stream.write(
-                        "{val}\t".format(
-                            val=self.data.tables["values"].values[idx][col_idx]
-                        )
-                    )
-
-            self.output_stream.write("\n")
+        # assume that position data is ordered as easting, northing, elevation
+        # (otherwise a PROJ axisswap operation can fix that). Epochs are written if
+        # they are present.
+        positions, epochs, velocities, values = (
+            self.data.tables[name]
+            for name in ("positions", "epochs", "velocities", "values")
+        )
+        num_obs = self.data.num_obs
+        coordinates = _columns(positions, num_obs)
+        if epochs.has_data:
+            coordinates += _columns(epochs, num_obs)[:1]
+
+        # everything after the coordinates is considered a comment by PROJ: write
+        # velocities and additional values if they are present
+        comments = [
+            c for t in (velocities, values) if t.has_data for c in _columns(t, num_obs)
+        ]
+
+        # Convert each column to Python objects in one go, so that a single format
+        # string renders whole rows with the same text as str() on the numpy values.
+        # Rows are written many at a time.
+        row_fmt = "{}\t" * len(coordinates) + "#  " + "{}\t" * len(comments) + "\n"
+        columns = coordinates + comments
+        write = self.output_stream.write
+        for start in range(0, num_obs, _ROWS_PER_WRITE):
+            rows = [_as_objects(c[start : start + _ROWS_PER_WRITE]) for c in columns]
+            write("".join(map(row_fmt.format, *rows)))
+
+
+def _columns(table: Table, num_obs: int) -> List[np.ndarray]:
+    """Columns of one table in a dataset
+
+    The columns are the contiguous arrays stored in the table, so that the 2D values
+    of the table are never assembled. Missing columns are filled with NaN.
+
+    Args:
+        table:    Table in the dataset.
+        num_obs:  Number of observations in the dataset.
+
+    Returns:
+        One array for each column in the table.
+    """
+    columns = (table.column(col_idx) for col_idx in range(table.num_cols))
+    return [np.full(num_obs, np.nan) if c is None else c for c in columns]
+
+
+def _as_objects(values: np.ndarray) -> List[Any]:
+    """Values of one column as Python objects that are formatted like numpy values
+
+    Python floats are formatted like float64 values. Other floats, for instance
+    float32 values, are formatted by numpy, as they would otherwise get extra digits.
+
+    Args:
+        values:  Values in one column.
+
+    Returns:
+        Python objects with the same text as str() on the numpy values.
+    """
+    if values.dtype.kind == "f" and values.dtype != np.float64:
+        return values.astype(str).tolist()
+    return values.tolist()
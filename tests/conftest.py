@@ -8,8 +8,24 @@ import pathlib
 # Third party imports
 import pytest
 
+# Posetta imports
+from posetta.lib import plugins
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def path_examples():
     """Path to the examples directory"""
-    return pathlib.Path(__file__).parent.parent / "example_files"
+    return pathlib.Path(__file__).resolve().parents[1] / "example_files"
+
+
+@pytest.fixture(scope="session")
+def kms_paths(path_examples):
+    """Paths to the KMS example files, by name"""
+    base = path_examples / "kms"
+    return {"koordinater": base / "koordinater", "koter": base / "koter"}
+
+
+@pytest.fixture(scope="session")
+def reader_plugins():
+    """Names of the reader plug-ins, found once per test session"""
+    return plugins.list_all("posetta.readers")
@@ -0,0 +1,171 @@
+"""Tests for the data.coordset module
+
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Posetta imports
+from posetta.data import CoordSet
+from posetta.lib import exceptions
+
+
+#
+# Test data sets
+#
+@pytest.fixture
+def cset():
+    cset = CoordSet()
+    cset.add("positions", np.array([1.0, 2.0]), 0, "easting")
+    cset.add("positions", np.array([3.0, 4.0]), 1, "northing")
+    cset.add("values", np.array(["A", "B"]), None, "station")
+    cset.add("values", np.array([0.5, 0.25]), None, "quality")
+
+    return cset
+
+
+#
+# Tests
+#
+def test_add_positions(cset):
+    """Test that positions are stored in the given columns"""
+    assert cset.positions.values.shape == (2, 3)
+    assert cset.positions.values[1, 0] == 2.0
+    assert cset.positions.values[0, 1] == 3.0
+
+
+def test_add_values_expands_table(cset):
+    """Test that values are added as new columns of the values table"""
+    assert cset.values.num_cols == 2
+    assert cset.values.col_names == ["station", "quality"]
+    assert cset.values.values.shape == (2, 2)
+
+
+def test_as_dict_keeps_column_types(cset):
+    """Test that as_dict returns the columns as they were added"""
+    data = cset.as_dict()
+    assert list(data["station"]) == ["A", "B"]
+    assert data["quality"].dtype == np.float64
+    assert data["northing"][1] == 4.0
+
+
+def test_add_inconsistent_num_obs(cset):
+    """Test that adding a column with a different number of rows fails"""
+    with pytest.raises(exceptions.CoordSetError):
+        cset.add("epochs", np.array([2018.0]), 0, "epoch")
+
+
+def test_fixed_table_not_expandable(cset):
+    """Test that columns in fixed size tables need an index"""
+    with pytest.raises(ValueError):
+        cset.add("velocities", np.array([0.1, 0.2]), None, "vx")
+
+
+def test_unassigned_column_is_nan(cset):
+    """Test that columns not added to a fixed size table are read as NaN"""
+    assert np.isnan(cset.positions.values[:, 2]).all()
+    assert not cset.velocities.has_data
+    assert cset.velocities.values is None
+
+
+def test_as_dataframe_column_order(cset):
+    """Test that the DataFrame columns are in the order they were added"""
+    cset.add("epochs", np.array([2018.0, 2019.0]), 0, "epoch")
+    df = cset.as_dataframe()
+    assert list(df.columns) == ["easting", "northing", "station", "quality", "epoch"]
+    assert df["quality"].dtype == np.float64
+
+
+def test_table_add_columns():
+    """Test that a block of columns can be added to a table at once"""
+    cset = CoordSet()
+    idxs = cset.positions.add_columns(["east", "north"], np.ones((4, 2)), [0, 1])
+    assert idxs == [0, 1]
+    assert cset.positions.col_names == ["east", "north", ""]
+    assert (cset.positions.values[:, :2] == 1).all()
+
+
+def test_add_block():
+    """Test that a block of columns can be added to the CoordSet at once"""
+    cset = CoordSet()
+    cset.add_block("values", np.arange(6.0).reshape(3, 2), ["a", "b"])
+    assert cset.num_obs == 3
+    assert list(cset.as_dict()) == ["a", "b"]
+    assert (cset.as_dict()["b"] == [1, 3, 5]).all()
+    with pytest.raises(exceptions.CoordSetError):
+        cset.add_block("positions", np.ones((4, 3)), ["x", "y", "z"], [0, 1, 2])
+
+
+def test_from_matrix():
+    """Test that a CoordSet can be created from a matrix, keeping the column order"""
+    matrix = np.arange(12.0).reshape(4, 3)
+    specs = [("values", None), ("positions", 0), ("positions", 1)]
+    cset = CoordSet.from_matrix(matrix, ["value", "east", "north"], specs)
+    assert cset.num_obs == 4
+    assert list(cset.as_dataframe().columns) == ["value", "east", "north"]
+    assert (cset.positions.values[:, 1] == matrix[:, 2]).all()
+
+
+def test_as_dict_shares_contiguous_columns():
+    """Test that as_dict() returns contiguous columns without copying them"""
+    matrix = np.arange(12.0).reshape(4, 3)
+    specs = [("positions", 0), ("positions", 1), ("positions", 2)]
+    cset = CoordSet.from_matrix(matrix, ["east", "north", "height"], specs)
+    columns = cset.as_dict()
+    for idx, column in enumerate(columns.values()):
+        assert column.flags["C_CONTIGUOUS"]
+        assert np.shares_memory(column, cset.positions.column(idx))
+
+
+def test_table_values_read_only(cset):
+    """Test that values can not be changed through the assembled 2D array"""
+    with pytest.raises(ValueError):
+        cset.positions.values[0, 0] = 10.0
+    assert cset.as_dict()["easting"][0] == 1.0
+
+
+def test_add_copies_values():
+    """Test that changing the added arrays afterwards does not change the CoordSet"""
+    cset = CoordSet()
+    column = np.array([1.0, 2.0])
+    block = np.array([[3.0, 4.0], [5.0, 6.0]])
+    cset.add("positions", column, 0, "easting")
+    cset.add_block("positions", block, ["northing", "height"], [1, 2])
+    column[0] = block[0, 0] = 10.0
+    assert cset.as_dict()["easting"][0] == 1.0
+    assert cset.as_dict()["northing"][0] == 3.0
+
+
+def test_repr_does_not_assemble_values(cset):
+    """Test that the representations do not assemble the values of the tables"""
+    assert repr(cset).startswith("CoordSet(positions")
+    assert repr(cset.tables["positions"]) == "Table((2, 3))"
+    assert cset.tables["positions"]._values is None
+
+
+def test_tables_created_when_used():
+    """Test that tables are only created when they are used"""
+    cset = CoordSet()
+    assert not cset.tables
+    cset.add("epochs", [2018.5, 2019.5], 0, "epoch")
+    assert list(cset.tables) == ["epochs"]
+    assert cset.positions.values is None
+
+
+def test_table_dtype():
+    """Test that the dtype of a table can be overridden"""
+    cset = CoordSet(dtypes=dict(velocities=np.float32))
+    cset.add("velocities", [0.01, 0.02], 0, "vx")
+    cset.add("positions", [1, 2], 0, "x")
+    assert cset.velocities.values.dtype == np.float32
+    assert cset.positions.values.dtype == np.float64
+
+
+def test_as_arrow_table(cset):
+    """Test that the dataset can be converted to a PyArrow Table"""
+    pa = pytest.importorskip("pyarrow")
+    table = cset.as_arrow_table()
+    assert table.column_names == ["easting", "northing", "station", "quality"]
+    assert table.column("northing").type == pa.float64()
+    assert table.column("station").to_pylist() == ["A", "B"]
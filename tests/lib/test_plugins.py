@@ -3,7 +3,9 @@
 """
 
 # Standard library imports
+import io
 import sys
+import types
 
 # Third party imports
 import pytest
@@ -14,24 +16,9 @@ from posetta.lib import plugins
 from posetta.readers._reader import Reader
 
 
-@pytest.fixture
-def tmpfile(tmpdir):
-    """A temporary file that can be read"""
-    file_path = tmpdir.join("test")
-    file_path.write("Temporary test file")
-
-    return file_path
-
-
 #
 # Tests
 #
-def test_package_not_empty():
-    """Test that list_all() finds some plugins in posetta.readers-package"""
-    readers = plugins.list_all("posetta.readers")
-    assert len(readers) > 0
-
-
 def test_package_empty():
     """Test that list_all() does not find any plugins in posetta.lib-package"""
     lib_plugins = plugins.list_all("posetta.lib")
@@ -44,13 +31,6 @@ def test_package_non_existing():
         plugins.list_all("posetta.non_existent")
 
 
-def test_plugin_exists():
-    """Test that an existing plugin returns True for exists()"""
-    package_name = "posetta.readers"
-    plugin_name = plugins.list_all(package_name)[0]
-    assert plugins.exists(package_name, plugin_name)
-
-
 @pytest.mark.parametrize("plugin_name", ["exceptions", "non_existent"])
 def test_plugin_exists_not(plugin_name):
     """Test that a non-existing plugin returns False for exists()
@@ -61,15 +41,63 @@ def test_plugin_exists_not(plugin_name):
     assert not plugins.exists("posetta.lib", plugin_name)
 
 
-def test_call_existing_plugin(tmpfile):
-    """Test that calling a reader-plugin returns a Reader instance"""
+def test_reader_plugins(reader_plugins):
+    """Test that reader plug-ins are listed, exist and return Reader instances"""
     package_name = "posetta.readers"
-    plugin_name = plugins.list_all(package_name)[0]
-    with open(tmpfile, mode="rb") as input_stream:
-        reader = plugins.call(package_name, plugin_name, input_stream=input_stream)
+    assert len(reader_plugins) > 0
+    assert all(plugins.exists(package_name, name) for name in reader_plugins)
+
+    input_stream = io.BytesIO(b"Temporary test file")
+    reader = plugins.call(package_name, reader_plugins[0], input_stream=input_stream)
     assert isinstance(reader, Reader)
 
 
 def test_call_non_exising_plugin():
     with pytest.raises(exceptions.UnknownPluginError):
         plugins.call("posetta.lib", "non_existent")
+
+
+def test_register_updates_cached_lookups(monkeypatch):
+    """Test that registering a plug-in updates cached list_all() and exists()"""
+    module = types.ModuleType("posetta_test.plugin", "Test plug-in")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setitem(plugins._PLUGINS, "posetta_test", dict())
+    monkeypatch.setattr(plugins, "_import_one", lambda *_: None)
+    monkeypatch.setattr(plugins, "_FULLY_IMPORTED", {"posetta_test"})
+    plugins._invalidate()
+    assert not plugins.exists("posetta_test", "plugin")
+    assert plugins.list_all("posetta_test") == ()
+
+    def plugin():
+        return 1
+
+    plugin.__module__ = module.__name__
+    plugins.register(plugin)
+    assert plugins.exists("posetta_test", "plugin")
+    assert plugins.list_all("posetta_test") == ("plugin",)
+
+
+def test_register_replaces_cached_plugin(monkeypatch):
+    """Test that registering a plug-in replaces an earlier, cached, plug-in"""
+    module = types.ModuleType("posetta_test.plugin", "Test plug-in")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setitem(plugins._PLUGINS, "posetta_test", dict())
+
+    def first_plugin():
+        return 1
+
+    def second_plugin():
+        return 2
+
+    for plugin, expected in ((first_plugin, 1), (second_plugin, 2)):
+        plugin.__module__ = module.__name__
+        plugins.register(plugin)
+        assert plugins.call("posetta_test", "plugin") == expected
+
+
+def test_prebound_plugin(reader_plugins):
+    """Test that a prebound plug-in is the same as the registered plug-in"""
+    package_name = "posetta.readers"
+    plugin_name = reader_plugins[0]
+    plugin = plugins.prebound(package_name, plugin_name)
+    assert plugin is plugins.load(package_name, plugin_name).function
@@ -0,0 +1,21 @@
+"""Common functions for all readers tests
+
+"""
+
+# Third party imports
+import pytest
+
+# Posetta imports
+from posetta import readers
+
+
+@pytest.fixture(scope="session")
+def kms_koordinater(kms_paths):
+    """Coordinate dataset read from the koordinater KMS example file"""
+    return readers.read_file(kms_paths["koordinater"], "kms").as_coordset()
+
+
+@pytest.fixture(scope="session")
+def kms_koter(kms_paths):
+    """Coordinate dataset read from the koter KMS example file"""
+    return readers.read_file(kms_paths["koter"], "kms").as_coordset()
@@ -2,51 +2,42 @@
 
 """
 
+# Third party imports
+import numpy as np
+import pytest
+
 # Posetta imports
 from posetta import readers
 
 
-def test_file_koordinater(path_examples):
+@pytest.mark.parametrize(
+    "file_name, col_idx, first, last",
+    [
+        ("koordinater", 0, 470321.583, 453615.626),
+        ("koordinater", 1, 6193448.053, 6182559.836),
+        ("koter", 2, 12.35840, 2.32457),
+    ],
+)
+def test_file(request, file_name, col_idx, first, last):
     """
-    KmsReader: koordinater
+    KmsReader: first and last station and coordinate in the example files
     """
-    reader = readers.read_file(path_examples / "kms" / "koordinater", "kms")
-    cset = reader.as_coordset()
+    cset = request.getfixturevalue(f"kms_{file_name}")
 
-    assert (
-        cset.values.values[0, 0] == "G.M.182/183"
-    )  # TODO: Add column name indexing on tables
-    assert cset.positions.values[0, 1] == 6193448.053
-    assert cset.positions.values[0, 0] == 470321.583
+    # TODO: Add column name indexing on tables
+    assert cset.values.values[0, 0] == "G.M.182/183"
+    assert cset.positions.values[0, col_idx] == first
 
     assert cset.values.values[-1, 0] == "134-10-09039"
-    assert cset.positions.values[-1, 1] == 6182559.836
-    assert cset.positions.values[-1, 0] == 453615.626
-
-    # assert reader.data["station"][0] == "G.M.182/183"
-    # assert reader.data["northing"][0] == 6193448.053
-    # assert reader.data["easting"][0] == 470321.583
+    assert cset.positions.values[-1, col_idx] == last
 
-    # assert reader.data["station"][-1] == "134-10-09039"
-    # assert reader.data["northing"][-1] == 6182559.836
-    # assert reader.data["easting"][-1] == 453615.626
 
-
-def test_file_koter(path_examples):
+def test_coordinates_as_arrays(kms_paths):
     """
-    KmsReader: koter
+    KmsReader: coordinates are stored as float arrays
     """
-    reader = readers.read_file(path_examples / "kms" / "koter", "kms")
-    cset = reader.as_coordset()
-
-    assert cset.values.values[0, 0] == "G.M.182/183"
-    assert cset.positions.values[0, 2] == 12.35840
-
-    assert cset.values.values[-1, 0] == "134-10-09039"
-    assert cset.positions.values[-1, 2] == 2.32457
-
-    # assert reader.data["station"][0] == "G.M.182/183"
-    # assert reader.data["elevation"][0] == 12.35840
+    reader = readers.read_file(kms_paths["koordinater"], "kms")
 
-    # assert reader.data["station"][-1] == "134-10-09039"
-    # assert reader.data["elevation"][-1] == 2.32457
+    for field in ("easting", "northing", "elevation"):
+        assert reader.data[field].dtype == np.float64
+        assert len(reader.data[field]) == len(reader.data["station"])
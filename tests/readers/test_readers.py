@@ -0,0 +1,172 @@
+"""Tests for the readers package
+
+"""
+
+# Standard library imports
+import io
+import sys
+import types
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Posetta imports
+from posetta import readers
+from posetta.lib import exceptions
+from posetta.lib import plugins
+from posetta.readers import _reader
+from posetta.readers._reader import Reader
+from posetta.readers._reader_line import LineReader
+
+
+class _ColumnReader(LineReader):
+    """A line reader with named columns, used for testing"""
+
+    def setup_reader(self):
+        names = ["east", "north"]
+        self.meta["__params__"] = dict(names=names, delimiter=",", skip_header=1)
+
+
+class _HeaderReader(LineReader):
+    """A line reader with names read from the header, used for testing"""
+
+    def setup_reader(self):
+        self.meta["__params__"] = dict(names=True)
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_read_file(path_examples, use_mmap):
+    """Test that a file is read the same with and without memory mapping"""
+    file_path = path_examples / "example.xyz"
+    reader = readers.read_file(file_path, "xyz", use_mmap=use_mmap)
+
+    assert reader.file_path == str(file_path)
+    assert reader.data["East"][0] == -25.0
+    assert reader.data["Value"][-1] == pytest.approx(0.01848)
+
+
+def test_read_empty_file(tmp_path):
+    """Test that an empty file, which can not be memory mapped, is still read"""
+    file_path = tmp_path / "empty"
+    file_path.write_bytes(b"")
+    reader = readers.read_file(file_path, "kms")
+
+    assert reader.data["station"] == []
+
+
+def test_as_dataframe(path_examples):
+    """Test that the data of a reader can be returned as a DataFrame"""
+    pytest.importorskip("pandas")
+    reader = readers.read_file(path_examples / "example.xyz", "xyz")
+    df = reader.as_dataframe(index="East")
+
+    assert list(df.columns) == ["North", "Value"]
+    assert df.index[0] == -25.0
+
+
+@pytest.mark.parametrize(
+    "text, north",
+    [
+        (b"East,North\n1.0,2.0\n3.0,4.0\n", 4.0),
+        (b"East,North\n1.0,2.0\n3.0,\n", np.nan),
+    ],
+)
+def test_line_reader(text, north):
+    """Test that a line reader handles both complete and missing values"""
+    reader = _ColumnReader(io.BytesIO(text))
+    reader.read()
+
+    assert list(reader.data) == ["east", "north"]
+    assert reader.data["east"][1] == 3.0
+    np.testing.assert_equal(reader.data["north"][1], north)
+    assert reader.data["north"].flags.c_contiguous
+
+
+@pytest.mark.parametrize("use_genfromtxt", [False, True])
+def test_line_reader_names_from_header(use_genfromtxt):
+    """Test that a line reader reads names from the header"""
+    reader = _HeaderReader(io.BytesIO(b"# East North\n1.0 2.0\n3.0 4.0\n"))
+    reader._use_genfromtxt = use_genfromtxt
+    reader.read()
+
+    assert list(reader.data) == ["East", "North"]
+    assert reader.data["North"].tolist() == [2.0, 4.0]
+
+
+def test_line_reader_as_dataframe():
+    """Test that numeric data from a line reader are converted to a DataFrame"""
+    pytest.importorskip("pandas")
+    reader = _ColumnReader(io.BytesIO(b"East,North\n1.0,2.0\n3.0,4.0\n"))
+    reader.read()
+    df = reader.as_dataframe()
+
+    assert list(df.columns) == ["east", "north"]
+    assert df["north"].tolist() == [2.0, 4.0]
+
+
+def test_identify_no_reader():
+    """Test that an unidentified stream raises an error"""
+    with pytest.raises(exceptions.NoReaderFound):
+        readers.read_stream(io.BytesIO(b"1 2 3\n"))
+
+
+def test_reader_subclass_registered(monkeypatch):
+    """Test that subclasses of Reader are registered as plug-ins when defined"""
+    module = types.ModuleType("posetta_test.my_format", "Test reader")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setitem(plugins._PLUGINS, "posetta_test", dict())
+    monkeypatch.setattr(_reader, "_REGISTERED_READERS", dict())
+
+    class MyFormat(Reader):
+        __module__ = module.__name__
+
+    assert plugins.load("posetta_test", "my_format").function is MyFormat
+
+
+def test_reader_subclass_register_opt_out(monkeypatch):
+    """Test that a helper base class can opt out, and a second reader is an error"""
+    module = types.ModuleType("posetta_test.my_other_format", "Test reader")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setitem(plugins._PLUGINS, "posetta_test", dict())
+    monkeypatch.setattr(_reader, "_REGISTERED_READERS", dict())
+
+    class MyBaseReader(Reader, register=False):
+        __module__ = module.__name__
+
+    class MyOtherFormat(MyBaseReader):
+        __module__ = module.__name__
+
+    assert plugins.load("posetta_test", "my_other_format").function is MyOtherFormat
+
+    with pytest.raises(exceptions.ReaderError):
+
+        class MySecondFormat(MyBaseReader):
+            __module__ = module.__name__
+
+    assert plugins.load("posetta_test", "my_other_format").function is MyOtherFormat
+
+
+def test_as_dict_read_only(path_examples):
+    """Test that the data of a reader are returned as a read-only dictionary"""
+    reader = readers.read_file(path_examples / "example.xyz", "xyz")
+    data = reader.as_dict(include_meta=True)
+
+    assert data["__meta__"]["__reader_name__"] == "xyz"
+    assert data["East"] is reader.data["East"]
+    with pytest.raises(TypeError):
+        data["East"] = None
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_read_text(path_examples, use_mmap):
+    """Test that the rest of the input is read as text, also from a memory map"""
+    file_path = path_examples / "example.xyz"
+    open_file = readers._open_mapped if use_mmap else readers._open_buffered
+    with open_file(file_path) as input_stream:
+        reader = Reader(input_stream)
+        header = input_stream.readline()
+        text = reader.read_text()
+        assert reader.read_text() == ""
+
+    assert header.decode() + text == file_path.read_text()
@@ -0,0 +1,58 @@
+"""Tests for the readers.xyz module
+
+"""
+
+# Standard library imports
+import io
+
+# Third party imports
+import pytest
+
+# Posetta imports
+from posetta import readers
+
+
+def read_xyz(text):
+    """Read an xyz-file from text"""
+    return readers.read_stream(io.BytesIO(text.encode()), "xyz")
+
+
+def test_header_in_comment():
+    """
+    XyzReader: names are read from a header starting with #
+    """
+    reader = read_xyz("# East North Value\n1 2 3\n4 5 6\n")
+
+    assert list(reader.data) == ["East", "North", "Value"]
+    assert reader.data["Value"].tolist() == [3.0, 6.0]
+
+
+def test_duplicate_header_names():
+    """
+    XyzReader: duplicate names are made unique, and the CoordSet agrees with data
+    """
+    reader = read_xyz("x y x\n1 2 3\n4 5 6\n")
+    cset = reader.as_coordset()
+
+    assert list(reader.data) == ["x", "y", "x_1"]
+    assert list(cset.as_dict()) == list(reader.data)
+    assert reader.data["x"].tolist() == [1.0, 4.0]
+    assert cset.as_dict()["x_1"].tolist() == [3.0, 6.0]
+    assert cset.positions.column(0).tolist() == reader.data["x"].tolist()
+
+
+def test_header_names_sanitized():
+    """
+    XyzReader: names are sanitized like np.genfromtxt does
+    """
+    reader = read_xyz("Value-1 b\n1 2\n")
+
+    assert list(reader.data) == ["Value1", "b"]
+
+
+def test_extra_columns():
+    """
+    XyzReader: more data columns than names in the header is an error
+    """
+    with pytest.raises(ValueError):
+        read_xyz("x y\n1 2 3\n4 5 6\n")
@@ -0,0 +1,41 @@
+"""Tests for the command line workflow in __main__
+
+"""
+
+# Third party imports
+import click
+import pytest
+
+# Posetta imports
+from posetta import __main__ as posetta_main
+
+
+def test_batch_translate(path_examples, tmp_path):
+    """Test that all files in a directory are translated"""
+    posetta_main.batch_translate(path_examples / "kms", tmp_path, "kms", "csv")
+
+    file_names = sorted(p.name for p in tmp_path.iterdir())
+    assert file_names == ["koordinater.csv", "koter.csv"]
+
+
+def test_batch_translate_unknown_format(path_examples, tmp_path):
+    """Test that an unknown format is reported before anything is translated"""
+    with pytest.raises(click.BadParameter):
+        posetta_main.batch_translate(path_examples / "kms", tmp_path, "kms", "unknown")
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_batch_translate_duplicate_output(path_examples, tmp_path):
+    """Test that input files with the same output file are reported up front"""
+    dir_from = tmp_path / "from"
+    dir_from.mkdir()
+    kms_file = (path_examples / "kms" / "koter").read_bytes()
+    (dir_from / "koter.kms").write_bytes(kms_file)
+    (dir_from / "koter.txt").write_bytes(kms_file)
+
+    dir_to = tmp_path / "to"
+    with pytest.raises(click.BadParameter, match="koter.csv"):
+        posetta_main.batch_translate(dir_from, dir_to, "kms", "csv")
+
+    assert not dir_to.exists()
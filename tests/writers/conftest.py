@@ -3,27 +3,68 @@
 """
 
 # System library imports
+import itertools
 import pathlib
 import sys
 
 # Third party imports
+import numpy as np
 import pytest
 
 # Posetta imports
 from posetta import writers
+from posetta.data import CoordSet
 
 
-@pytest.fixture
-def write_and_read(tmpdir):
+@pytest.fixture(scope="session")
+def make_cset():
+    """Factory for coordinate datasets
+
+    Creates a function that builds a CoordSet from whole columns of positions, and
+    optionally epochs and named comment columns.
+    """
+
+    def _make_cset(eastings, northings, elevations, epochs=None, comments=()):
+        cset = CoordSet()
+        positions = [
+            ("easting", eastings), ("northing", northings), ("elevation", elevations)
+        ]
+        for idx, (name, vals) in enumerate(positions):
+            cset.add("positions", np.asarray(vals, dtype=np.float64), idx, name)
+        if epochs is not None:
+            cset.add("epochs", np.asarray(epochs, dtype=np.float64), 0, "epoch")
+        for name, vals in comments:
+            cset.add("values", np.asarray(vals), None, name)
+        return cset
+
+    return _make_cset
+
+
+@pytest.fixture(scope="session")
+def writers_tmp_path(tmp_path_factory):
+    """Temporary directory shared by all writer tests"""
+    return tmp_path_factory.mktemp("writers")
+
+
+@pytest.fixture(scope="session")
+def write_and_read(writers_tmp_path):
     """Factory for write and read functions
 
     Creates a function that can write a CoordSet to a temporary file
-    using the given writer, and then reads back the file as a string.
+    using the given writer, and then reads back the file as a string. Each
+    call writes to a new file in a directory shared by all writer tests.
+
+    For long output, a match function can be given instead. It is called with
+    the raw bytes of the file, and its result is returned, so that the output
+    is not decoded.
     """
+    counter = itertools.count()
 
-    def _write_and_read(writer, cset, encoding="utf-8"):
-        file_path = tmpdir.join(f"test_{writer}")
+    def _write_and_read(writer, cset, encoding="utf-8", match=None):
+        file_path = writers_tmp_path / f"test_{writer}_{next(counter)}"
         writers.write_file(file_path, writer, cset)
+        if match is not None:
+            return match(file_path.read_bytes())
         return file_path.read_text(encoding=encoding)
 
     return _write_and_read
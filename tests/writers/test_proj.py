@@ -4,52 +4,55 @@
 import sys
 
 # Third party imports
+import numpy as np
 import pytest
 
 # Posetta imports
-from posetta.data import CoordSet
 from posetta import writers
+from posetta.data import CoordSet
 
 
 #
 # Test data sets
 #
-@pytest.fixture
-def xyz():
-    cset = CoordSet()
-    cset.add("positions", (687071.44,), 0, "easting")
-    cset.add("positions", (6210141.33,), 1, "northing")
-    cset.add("positions", (10,), 2, "elevation")
+def xyz(make_cset):
+    cset = make_cset([687071.44], [6210141.33], [10.0])
 
     expected = "687071.44\t6210141.33\t10.0\t#  \n"
 
     return cset, expected
 
 
-@pytest.fixture
-def xyzt():
-    cset, _ = xyz()
-    cset.add("epochs", (2018.75,), 0, "epoch")
+def xyzt(make_cset):
+    cset = make_cset([687071.44], [6210141.33], [10.0], epochs=[2018.75])
 
     expected = "687071.44\t6210141.33\t10.0\t2018.75\t#  \n"
 
     return cset, expected
 
 
-def xyzt_comment():
-    cset, _ = xyzt()
-    cset.add("values", ("testing",), None, "comment1")
-    cset.add("values", ("TESTING",), None, "comment2")
+def xyzt_comment(make_cset):
+    comments = [("comment1", ["testing"]), ("comment2", ["TESTING"])]
+    cset = make_cset(
+        [687071.44], [6210141.33], [10.0], epochs=[2018.75], comments=comments
+    )
 
     expected = "687071.44\t6210141.33\t10.0\t2018.75\t#  testing\tTESTING\t\n"
 
     return cset, expected
 
 
+@pytest.fixture(
+    scope="module", params=[xyz, xyzt, xyzt_comment], ids=lambda param: param.__name__
+)
+def data(request, make_cset):
+    """Coordinate dataset and the expected output, built once per module"""
+    return request.param(make_cset)
+
+
 #
 # Tests
 #
-@pytest.mark.parametrize("data", [xyz(), xyzt(), xyzt_comment()])
 def test_proj_write_to_file(write_and_read, data):
     """Test writing to file
     """
@@ -57,11 +60,39 @@ def test_proj_write_to_file(write_and_read, data):
     assert write_and_read("proj", cset) == expected
 
 
-@pytest.mark.parametrize("data", [xyz(), xyzt(), xyzt_comment()])
-def test_proj_write_to_stdout(capsys, data):
+def test_proj_write_many_rows(monkeypatch, write_and_read, make_cset):
+    """Test writing more rows than are formatted at a time
+    """
+    from posetta.writers import proj
+
+    num_obs = 1000
+    monkeypatch.setattr(proj, "_ROWS_PER_WRITE", 64)
+    cset = make_cset(range(num_obs), range(num_obs), [10.0] * num_obs)
+
+    def match(output):
+        return (
+            output.startswith(b"0.0\t0.0\t10.0\t#  \n1.0\t1.0\t10.0\t#  \n")
+            and output.endswith(b"999.0\t999.0\t10.0\t#  \n")
+            and output.count(b"\n") == num_obs
+        )
+
+    assert write_and_read("proj", cset, match=match)
+
+
+def test_proj_write_float32(write_and_read):
+    """Test that float32 values are written with the digits of the float32 values
+    """
+    cset = CoordSet(dtypes=dict(positions=np.float32))
+    cset.add("positions", [0.1], 0, "easting")
+    cset.add("positions", [1e20], 1, "northing")
+
+    assert write_and_read("proj", cset) == "0.1\t1e+20\tnan\t#  \n"
+
+
+def test_proj_write_to_stdout(capfdbinary, data):
     cset, expected = data
     writers.write_stream(sys.stdout.buffer, "proj", cset)
-    stdout, stderr = capsys.readouterr()
+    stdout, stderr = capfdbinary.readouterr()
 
-    assert stdout == expected
-    assert stderr == ""
+    assert stdout.decode() == expected
+    assert stderr == b""
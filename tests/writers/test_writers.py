@@ -0,0 +1,57 @@
+"""Tests for the writers package
+
+"""
+
+# Standard library imports
+import io
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Posetta imports
+from posetta import writers
+from posetta.data import CoordSet
+
+
+def test_write_stream_keeps_stream_open():
+    """Test that the written output is flushed, and the stream is left open"""
+    cset = CoordSet()
+    cset.add("positions", [1.5, 2.5], 0, "easting")
+    cset.add("values", ["ø", "å"], None, "comment")
+    output_stream = io.BytesIO()
+    writers.write_stream(output_stream, "proj", cset)
+
+    assert not output_stream.closed
+    expected = "1.5\tnan\tnan\t#  ø\t\n2.5\tnan\tnan\t#  å\t\n"
+    assert output_stream.getvalue().decode() == expected
+
+
+def test_csv_written_in_chunks(monkeypatch):
+    """Test that csv-files written in chunks are the same as one DataFrame"""
+    from posetta.writers import csv
+
+    cset = CoordSet()
+    cset.add("positions", [1.5, 2.5, 3.25], 0, "easting")
+    cset.add("values", ["a", "b", "c"], None, "comment")
+    monkeypatch.setattr(csv, "_ROWS_PER_WRITE", 2)
+    monkeypatch.setattr(csv, "_MAX_ROWS_WITHOUT_PANDAS", 0)
+    output_stream = io.BytesIO()
+    writers.write_stream(output_stream, "csv", cset)
+
+    expected = cset.as_dataframe().to_csv()
+    assert output_stream.getvalue().decode() == expected
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_small_csv_written_without_pandas(dtype):
+    """Test that small csv-files are written the same way as Pandas writes them"""
+    cset = CoordSet(dtypes=dict(positions=dtype))
+    cset.add("positions", [0.1, 1e-05, 1e20], 0, "easting")
+    cset.add("values", ["a", "b,c", 'd"'], None, "comment")
+    output_stream = io.BytesIO()
+    writers.write_stream(output_stream, "csv", cset)
+
+    expected = cset.as_dataframe().to_csv()
+    assert output_stream.getvalue().decode() == expected
+